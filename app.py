@@ -4,13 +4,47 @@
 # Menggunakan Flask untuk membuat antarmuka web yang memungkinkan pengguna memasukkan data proses
 # dan melihat hasil simulasi berbagai algoritma penjadwalan
 
-from flask import Flask, render_template, request
+import math
+import os
+
+from flask import Flask, Response, jsonify, render_template, request
+from incremental import resimulate, simulate
+from instrumentation import registry
 # Mengimpor modul inti dari file logika kita (scheduler.py)
-from scheduler import Process, run_all_schedulers, get_default_processes
+from jobs import DONE, JobManager
+from multicore import MULTICORE_ALGORITHMS, MULTICORE_MODES, simulate_multicore
+from scheduler import (ALGORITHM_ALIASES, ALGORITHMS, DEFAULT_TIME_QUANTUM, Process, ProcessTable,
+                       get_default_processes)
+from result_cache import ResultCache, workload_fingerprint
+from trace_loader import load_trace_stream, parse_process_row
 
 # Membuat instance aplikasi Flask
 app = Flask(__name__)
 
+# Cache hasil simulasi dan halaman HTML yang sudah dirender, dengan kunci fingerprint workload.
+# Workload yang dikirim ulang (termasuk data default) langsung dilayani tanpa simulasi/render ulang.
+result_cache = ResultCache()
+page_cache = ResultCache()
+# Simulasi terakhir beserta checkpoint mesinnya (lihat incremental.py), dengan kunci fingerprint yang sama.
+# Saat user mengedit tabel proses dan submit ulang, simulasi dilanjutkan dari checkpoint sebelum edit.
+# Checkpoint workload besar cukup berat, jadi yang disimpan lebih sedikit dari cache hasil.
+simulation_cache = ResultCache(max_entries=16)
+
+# Instrumentasi simulasi (counter dan timing fase, ditampilkan di /metrics) bersifat opt-in: mati secara
+# default; SCHEDULER_INSTRUMENT=1 menyalakannya, SCHEDULER_INSTRUMENT=cprofile/tracemalloc sekaligus
+# memprofil setiap simulasi. /metrics melaporkan statusnya lewat scheduler_instrumentation_enabled.
+INSTRUMENT = os.environ.get('SCHEDULER_INSTRUMENT', '0')
+INSTRUMENT = None if INSTRUMENT in ('', '0') else True if INSTRUMENT == '1' else INSTRUMENT
+
+# Job simulasi dari API JSON: workload kecil dijawab langsung, workload besar dijalankan di process pool
+job_manager = JobManager()
+
+# Kolom satu baris proses pada hasil API, dan batas ukuran halaman hasil
+PROCESS_FIELDS = ('pid', 'arrival_time', 'burst_time', 'priority',
+                  'start_time', 'completion_time', 'turnaround_time', 'waiting_time')
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 10000
+
 def parse_form_data(form):
     """
     Fungsi parse_form_data:
@@ -27,21 +61,66 @@ def parse_form_data(form):
 
     for i in range(len(pids)):
         try:
-            # 1. Konversi ke Integer: Wajib dilakukan karena input form selalu berupa string
-            pid = int(pids[i])
-            arrival = int(arrivals[i])
-            burst = int(bursts[i])
-            priority = int(priorities[i])
-            
-            # 2. Validasi Dasar: Memastikan data input valid (misal, Burst Time harus positif)
-            if burst > 0:
-                processes.append(Process(pid, arrival, burst, priority))
-        except (ValueError, IndexError):
-            # Penanganan Error: Jika input non-angka atau tidak lengkap, entry tersebut dilewati
-            # Ini mencegah aplikasi crash karena input user yang salah.
+            values = (pids[i], arrivals[i], bursts[i], priorities[i])
+        except IndexError:
+            # Penanganan Error: Jika input tidak lengkap, entry tersebut dilewati
             continue
+
+        # Konversi ke Integer dan Validasi Dasar (misal, Burst Time harus positif):
+        # aturan yang sama dipakai loader trace CSV (trace_loader.parse_process_row).
+        # Entry non-angka atau tidak valid dilewati, mencegah aplikasi crash karena input user yang salah.
+        row = parse_process_row(values)
+        if row is not None:
+            processes.append(Process(*row))
+    return processes
+
+def parse_json_processes(rows):
+    """
+    Mengonversi daftar proses dari JSON ([pid, arrival, burst, priority] atau objek dengan kunci
+    pid/arrival_time/burst_time/priority) menjadi list objek Process, dengan validasi yang sama seperti form.
+    """
+    processes = []
+    for item in rows or []:
+        if isinstance(item, dict):
+            item = [item.get('pid'), item.get('arrival_time'), item.get('burst_time'), item.get('priority', 0)]
+        try:
+            row = parse_process_row(item)
+        except TypeError:
+            row = None  # Nilai null/objek di JSON: entry dilewati seperti input form yang tidak valid
+        if row is not None:
+            processes.append(Process(*row))
     return processes
 
+def get_results(processes, time_quantum=DEFAULT_TIME_QUANTUM, base=None):
+    """
+    Hasil semua algoritma (bentuk run_all_schedulers) untuk workload ini, diambil dari cache jika sudah pernah
+    dihitung. `base` opsional: fingerprint workload sebelum diedit; jika simulasinya masih ada di
+    simulation_cache, hanya bagian jadwal setelah proses pertama yang berubah yang disimulasikan ulang.
+    """
+    key = workload_fingerprint(processes, time_quantum=time_quantum)
+
+    def compute():
+        previous = simulation_cache.get(base) if base else None
+        if previous is not None and previous.time_quantum == time_quantum:
+            simulation = resimulate(previous, processes, instrument=INSTRUMENT)
+        else:
+            simulation = simulate(processes, time_quantum=time_quantum, instrument=INSTRUMENT)
+        simulation_cache.put(key, simulation)
+        return simulation.results
+    return result_cache.get_or_compute(key, compute)
+
+def render_simulation(processes, base=None):
+    """ Halaman hasil simulasi untuk workload ini; HTML yang sudah dirender disimpan di page_cache. """
+    fingerprint = workload_fingerprint(processes, time_quantum=DEFAULT_TIME_QUANTUM)
+    # Hasil diambil (atau dihitung ulang jika sudah keluar dari cache) sebelum halaman dilayani,
+    # agar permintaan /api/gantt dengan fingerprint halaman ini selalu menemukannya di result_cache
+    results = get_results(processes, base=base)
+
+    def render():
+        # `fingerprint` dipakai JavaScript untuk meminta data Gantt chart per viewport ke /api/gantt
+        return render_template('index.html', results=results, processes=processes, fingerprint=fingerprint)
+    return page_cache.get_or_compute(fingerprint, render)
+
 @app.route('/', methods=['GET', 'POST'])
 def index():
     """
@@ -52,6 +131,8 @@ def index():
         # 1. POST Request (Ketika user SUBMIT data):
         # Ambil dan validasi data dari form
         processes = parse_form_data(request.form)
+        # Fingerprint workload sebelum diedit (hidden field): basis simulasi ulang inkremental
+        base = request.form.get('base')
         
         # Penanganan data kosong/invalid: Jika tidak ada proses valid, gunakan data default
         if not processes: 
@@ -60,14 +141,268 @@ def index():
         # 2. GET Request (Akses halaman PERTAMA KALI):
         # Tampilkan data proses default sebagai contoh awal di form
         processes = get_default_processes()
+        base = None
     
-    # 3. Eksekusi Simulasi: Panggil fungsi dari scheduler.py
-    # 'results' akan berisi data terstruktur dari FCFS, SJF, RR, dan Priority
-    results = run_all_schedulers(processes)
-    
-    # 4. Render ke Frontend: Kirim hasil perhitungan dan data proses yang digunakan
-    # ke template HTML (index.html) untuk visualisasi.
-    return render_template('index.html', results=results, processes=processes)
+    # 3. Eksekusi Simulasi dan Render ke Frontend: simulasi semua algoritma (scheduler.py) yang lalu dirender
+    # ke template HTML (index.html). Keduanya di-cache berdasarkan fingerprint workload, jadi data yang sama
+    # tidak dihitung ulang; workload hasil edit dilanjutkan dari checkpoint simulasi `base` (incremental.py).
+    return render_simulation(processes, base)
+
+def parse_time_window(t0, t1, makespan):
+    """
+    Jendela waktu [t0, t1) viewport Gantt chart dari input klien (JSON atau query string); default [0, makespan).
+    Melempar ValueError jika t0/t1 bukan angka berhingga (inf/nan). t1 paling kecil t0 + 1.
+    """
+    try:
+        t0 = float(0 if t0 is None else t0)
+        t1 = float(makespan if t1 is None else t1)
+    except (TypeError, ValueError):
+        raise ValueError('t0 dan t1 harus berupa angka')
+    if not (math.isfinite(t0) and math.isfinite(t1)):
+        raise ValueError('t0 dan t1 harus berupa angka berhingga')
+    return t0, max(t1, t0 + 1)
+
+@app.route('/api/gantt', methods=['POST'])
+def gantt_viewport():
+    """
+    Endpoint JSON untuk Gantt chart yang dirender per viewport.
+    Body: {"fingerprint": "<hex>", "algorithm": "FCFS", "t0": 0, "t1": 100, "width": 800}
+    Halaman web mengirim fingerprint workload-nya, jadi hasil dibaca langsung dari result_cache tanpa
+    mengirim, mem-parse, atau meng-hash ulang data proses: biaya tiap zoom/geser sebanding dengan jendela,
+    bukan panjang trace (404 jika hasilnya sudah keluar dari cache). Klien lain boleh mengirim
+    "processes": [[pid, arrival, burst, priority], ...] dan "time_quantum" sebagai ganti fingerprint.
+    Mengembalikan segmen yang sudah dikelompokkan per PID dan di-downsample untuk jendela [t0, t1)
+    serta tick sumbu waktu yang kepadatannya dibatasi lebar piksel, sehingga halaman hanya
+    menggambar bagian yang terlihat, berapa pun panjang makespan-nya.
+    """
+    payload = request.get_json(silent=True) or {}
+    algorithm = payload.get('algorithm')
+    if algorithm not in ALGORITHMS:
+        return jsonify({'error': f"Algoritma tidak dikenal: {algorithm}"}), 400
+    try:
+        time_quantum = int(payload.get('time_quantum', DEFAULT_TIME_QUANTUM))
+        width = max(1, min(int(payload.get('width', 1000)), 10000))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'time_quantum dan width harus bilangan bulat'}), 400
+    if time_quantum <= 0:
+        return jsonify({'error': 'Time quantum harus bilangan bulat positif'}), 400
+
+    fingerprint = payload.get('fingerprint')
+    if fingerprint:
+        results = result_cache.get(str(fingerprint))
+        if results is None:
+            return jsonify({'error': 'Hasil simulasi sudah tidak ada di cache; jalankan simulasi ulang'}), 404
+    else:
+        processes = parse_json_processes(payload.get('processes')) or get_default_processes()
+        results = get_results(processes, time_quantum)
+    gantt_chart = results[algorithm]['gantt_chart']
+    try:
+        t0, t1 = parse_time_window(payload.get('t0'), payload.get('t1'), gantt_chart.makespan)
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    view = gantt_chart.viewport(t0, t1, width)
+    view['algorithm'] = algorithm
+    return jsonify(view)
+
+def parse_simulation_request(payload, upload=None):
+    """
+    Mengubah satu permintaan simulasi API menjadi (ProcessTable, daftar algoritma, time_quantum).
+    Proses diambil dari file trace yang di-upload (CSV atau biner, lihat trace_loader) jika ada,
+    selain itu dari payload['processes']. Melempar ValueError untuk input yang tidak valid.
+    """
+    if upload is not None:
+        table = load_trace_stream(upload.stream, upload.filename or '<upload>')
+    else:
+        table = ProcessTable.from_processes(parse_json_processes(payload.get('processes')))
+    if not len(table):
+        raise ValueError("Tidak ada proses valid pada permintaan")
+
+    algorithms = payload.get('algorithms') or ALGORITHMS
+    if isinstance(algorithms, str):
+        algorithms = algorithms.split(',')  # Dari form multipart: "fcfs,rr"
+    algorithms = [ALGORITHM_ALIASES.get(str(name).strip().lower(), str(name).strip()) for name in algorithms]
+    try:
+        time_quantum = int(payload.get('time_quantum', DEFAULT_TIME_QUANTUM))
+    except (TypeError, ValueError):
+        raise ValueError("Time quantum harus bilangan bulat positif")
+    return table, algorithms, time_quantum
+
+def submit_simulation(payload, upload=None):
+    """ Membuat job dari satu permintaan simulasi; mengembalikan (ringkasan job, HTTP status). """
+    try:
+        job = job_manager.submit(*parse_simulation_request(payload, upload))
+    except ValueError as exc:
+        return {'error': str(exc)}, 400
+    return job_response(job)
+
+def job_response(job):
+    """ Ringkasan job untuk respons API beserta HTTP status: 200 jika sudah selesai, 202 jika di latar belakang. """
+    summary = job.summary()
+    summary['status_url'] = f"/api/simulations/{job.id}"
+    return summary, 200 if job.status == DONE else 202
+
+def get_finished_job(job_id):
+    """ Job yang sudah selesai beserta nama algoritma dari query string, atau (None, response error). """
+    job = job_manager.get(job_id)
+    if job is None:
+        return None, (jsonify({'error': f"Job tidak ditemukan: {job_id}"}), 404)
+    if job.status != DONE:
+        return None, (jsonify(job.summary()), 409)
+    algorithm = request.args.get('algorithm', job.algorithms[0])
+    algorithm = ALGORITHM_ALIASES.get(algorithm.lower(), algorithm)
+    if algorithm not in job.results:
+        return None, (jsonify({'error': f"Algoritma tidak ada pada job ini: {algorithm}"}), 400)
+    return (job, algorithm), None
+
+@app.route('/api/simulations', methods=['POST'])
+def create_simulation():
+    """
+    Membuat satu simulasi. Body JSON {"processes": [...], "algorithms": ["FCFS", "rr"], "time_quantum": 2},
+    atau multipart dengan file trace pada field `trace` (parameter lain sebagai field form).
+    Workload kecil dijawab langsung (200, status "done"); workload besar dijalankan di latar belakang
+    (202) dan statusnya dipantau lewat `status_url`.
+    """
+    upload = request.files.get('trace')
+    payload = request.form if upload is not None else request.get_json(silent=True) or {}
+    summary, status = submit_simulation(payload, upload)
+    return jsonify(summary), status
+
+@app.route('/api/simulations/batch', methods=['POST'])
+def create_simulation_batch():
+    """
+    Membuat banyak simulasi sekaligus: body {"simulations": [permintaan, ...]}, hasil per permintaan.
+    Biaya seluruh batch dijumlahkan (JobManager.submit_batch): setelah melewati batas inline, sisa
+    permintaan dijalankan di latar belakang, sehingga batch besar tidak memblokir thread request.
+    """
+    payload = request.get_json(silent=True) or {}
+    simulations = payload.get('simulations')
+    if not isinstance(simulations, list):
+        return jsonify({'error': 'Field simulations harus berupa list'}), 400
+    requests = []
+    for item in simulations:
+        try:
+            requests.append(parse_simulation_request(item if isinstance(item, dict) else {}))
+        except ValueError as exc:
+            requests.append(exc)
+    jobs = []
+    for outcome in job_manager.submit_batch(requests):
+        summary, status = ({'error': str(outcome)}, 400) if isinstance(outcome, ValueError) else job_response(outcome)
+        summary['http_status'] = status
+        jobs.append(summary)
+    return jsonify({'jobs': jobs})
+
+@app.route('/api/simulations/<job_id>')
+def simulation_status(job_id):
+    """ Status job (queued/running/done/failed) dan ringkasan metrik jika sudah selesai. """
+    job = job_manager.get(job_id)
+    if job is None:
+        return jsonify({'error': f"Job tidak ditemukan: {job_id}"}), 404
+    return jsonify(job.summary())
+
+@app.route('/api/simulations/<job_id>/processes')
+def simulation_processes(job_id):
+    """ Hasil per proses satu algoritma, per halaman: ?algorithm=FCFS&offset=0&limit=100. """
+    found, error = get_finished_job(job_id)
+    if error:
+        return error
+    job, algorithm = found
+    try:
+        offset = max(int(request.args.get('offset', 0)), 0)
+        limit = max(1, min(int(request.args.get('limit', DEFAULT_PAGE_SIZE)), MAX_PAGE_SIZE))
+    except ValueError:
+        return jsonify({'error': 'offset dan limit harus bilangan bulat'}), 400
+    processes = job.results[algorithm]['processes']
+    rows = [{field: getattr(p, field) for field in PROCESS_FIELDS} for p in processes[offset:offset + limit]]
+    return jsonify({'job_id': job.id, 'algorithm': algorithm, 'offset': offset, 'limit': limit,
+                    'total': len(processes), 'processes': rows})
+
+@app.route('/api/simulations/<job_id>/gantt')
+def simulation_gantt(job_id):
+    """ Gantt chart satu algoritma per viewport (sama seperti /api/gantt): ?algorithm=&t0=&t1=&width=. """
+    found, error = get_finished_job(job_id)
+    if error:
+        return error
+    job, algorithm = found
+    gantt_chart = job.results[algorithm]['gantt_chart']
+    try:
+        width = max(1, min(int(request.args.get('width', 1000)), 10000))
+    except ValueError:
+        return jsonify({'error': 'width harus bilangan bulat'}), 400
+    try:
+        t0, t1 = parse_time_window(request.args.get('t0'), request.args.get('t1'), gantt_chart.makespan)
+    except ValueError as exc:
+        return jsonify({'error': str(exc)}), 400
+    view = gantt_chart.viewport(t0, t1, width)
+    view['algorithm'] = algorithm
+    return jsonify(view)
+
+@app.route('/api/multicore', methods=['POST'])
+def multicore_simulation():
+    """
+    Simulasi multi-core. Body: {"processes": [...], "cores": 4, "algorithm": "SJF",
+    "mode": "global" | "per_core", "steal": true}. Mengembalikan metrik (termasuk utilisasi per core
+    dan ketidakseimbangan beban) serta satu lane Gantt chart per core (format GanttChart.to_dict).
+    """
+    payload = request.get_json(silent=True) or {}
+    processes = parse_json_processes(payload.get('processes')) or get_default_processes()
+    algorithm = payload.get('algorithm', 'FCFS')
+    algorithm = ALGORITHM_ALIASES.get(str(algorithm).lower(), algorithm)
+    mode = payload.get('mode', 'global')
+    if algorithm not in MULTICORE_ALGORITHMS or mode not in MULTICORE_MODES:
+        return jsonify({'error': f"Algoritma ({', '.join(MULTICORE_ALGORITHMS)}) atau mode ({', '.join(MULTICORE_MODES)}) tidak dikenal"}), 400
+    try:
+        cores = max(1, min(int(payload.get('cores', 4)), 1024))
+    except (TypeError, ValueError):
+        return jsonify({'error': 'cores harus bilangan bulat'}), 400
+
+    entry = simulate_multicore(processes, cores, algorithm, mode, bool(payload.get('steal', True)))
+    return jsonify({'algorithm': algorithm, 'cores': cores, 'mode': mode, 'steal': entry['steal'],
+                    'metrics': entry['metrics'], 'lanes': [chart.to_dict() for chart in entry['gantt_charts']]})
+
+@app.route('/api/cache')
+def cache_stats():
+    """ Statistik cache (jumlah entri, hit, miss, hit rate): hasil simulasi, halaman, dan simulasi ber-checkpoint. """
+    return jsonify({'results': result_cache.stats(), 'pages': page_cache.stats(),
+                    'simulations': simulation_cache.stats()})
+
+def _metric_lines(name, help_text, metric_type, samples):
+    """ Satu metrik dalam format teks Prometheus: baris HELP, TYPE, lalu satu baris per (label, nilai). """
+    lines = [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+    for labels, value in samples:
+        label_text = ','.join(f'{key}="{label}"' for key, label in labels.items())
+        lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return lines
+
+@app.route('/metrics')
+def metrics():
+    """
+    Metrik instrumentasi dalam format teks Prometheus: total counter mesin per algoritma
+    (dispatch, quantum, lompatan idle, context switch), waktu per fase, kedalaman ready queue
+    maksimum, serta hit/miss cache hasil. Hanya simulasi yang benar-benar dijalankan (cache miss) yang tercatat,
+    dan hanya jika instrumentasi dinyalakan (scheduler_instrumentation_enabled 1); hit/miss cache selalu tercatat.
+    """
+    snapshot = registry.snapshot()
+    lines = _metric_lines('scheduler_instrumentation_enabled',
+                          'Apakah instrumentasi simulasi aktif (SCHEDULER_INSTRUMENT)', 'gauge', [({}, int(bool(INSTRUMENT)))])
+    lines += _metric_lines('scheduler_runs_total', 'Jumlah simulasi per algoritma', 'counter',
+                          [({'algorithm': algorithm}, totals['runs']) for algorithm, totals in snapshot.items()])
+    for counter in registry.COUNTERS:
+        lines += _metric_lines(f'scheduler_{counter}_total', f'Total {counter} per algoritma', 'counter',
+                               [({'algorithm': algorithm}, totals[counter]) for algorithm, totals in snapshot.items()])
+    lines += _metric_lines('scheduler_max_ready_queue', 'Kedalaman ready queue maksimum saat dispatch', 'gauge',
+                           [({'algorithm': algorithm}, totals['max_ready_queue']) for algorithm, totals in snapshot.items()])
+    lines += _metric_lines('scheduler_phase_seconds_total', 'Total waktu per fase simulasi', 'counter',
+                           [({'algorithm': algorithm, 'phase': phase}, seconds)
+                            for algorithm, totals in snapshot.items() for phase, seconds in totals['phase_seconds'].items()])
+    for cache_name, cache in (('results', result_cache), ('pages', page_cache), ('simulations', simulation_cache)):
+        stats = cache.stats()
+        lines += _metric_lines(f'scheduler_cache_{cache_name}_hits_total', f'Cache hit ({cache_name})', 'counter', [({}, stats['hits'])])
+        lines += _metric_lines(f'scheduler_cache_{cache_name}_misses_total', f'Cache miss ({cache_name})', 'counter', [({}, stats['misses'])])
+    return Response('\n'.join(lines) + '\n', mimetype='text/plain; version=0.0.4')
+
+# Hasil workload default dihitung sekali saat aplikasi dimulai, sehingga GET pertama pun langsung dari cache
+with app.test_request_context('/'):
+    render_simulation(get_default_processes())
 
 if __name__ == '__main__':
     # Jalankan aplikasi Flask:
@@ -0,0 +1,215 @@
+# File benchmark.py: Benchmark algoritma penjadwalan di atas workload sintetis (workloads.py)
+# Mengukur waktu eksekusi, peak memory (tracemalloc), dan event per detik untuk setiap kombinasi
+# target x workload x jumlah job, lalu menyimpan hasilnya sebagai baseline JSON yang bisa
+# dibandingkan dengan run berikutnya (misal sebelum dan sesudah sebuah commit).
+#
+# Contoh: python benchmark.py --scales 10,1k,100k --output baseline.json
+#         python benchmark.py --scales 10,1k,100k --compare baseline.json
+
+import argparse
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import namedtuple
+
+from scheduler import (DEFAULT_TIME_QUANTUM, ProcessTable, fcfs_scheduling, np, preemptive_priority_scheduling,
+                       priority_scheduling, round_robin_scheduling, run_all_schedulers, sjf_scheduling,
+                       srtf_scheduling)
+from workloads import WORKLOADS, generate_workload
+
+# Satu baris hasil benchmark (juga satu entri pada file baseline JSON)
+BenchmarkResult = namedtuple('BenchmarkResult', [
+    'target', 'workload', 'jobs', 'seconds', 'median_seconds', 'peak_memory_bytes', 'events', 'events_per_second',
+])
+
+BASELINE_VERSION = 1
+# Waktu yang lebih lambat dari baseline lebih dari batas ini dianggap regresi
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+# --- Target Benchmark ---
+# Setiap target: (prepare, run). prepare(table) menyiapkan input di luar pengukuran waktu
+# (fungsi API lama mengubah list input, jadi setiap pengulangan mendapat list baru);
+# run(input, time_quantum) menjalankan simulasi dan mengembalikan jumlah event yang diproses:
+# satu event per kedatangan ditambah satu per segmen Gantt chart (dispatch atau idle).
+def _fresh_table(table):
+    """ Tabel baru di atas kolom yang sama, agar cache urutan kedatangan tidak terbawa antar pengulangan. """
+    return ProcessTable(table.pid, table.arrival_time, table.burst_time, table.priority)
+
+def _legacy_events(processes, output):
+    return len(processes) + len(output[1])
+
+def _run_all_events(table, time_quantum):
+    results = run_all_schedulers(table, time_quantum=time_quantum)
+    return sum(len(table) + len(entry['gantt_chart']) for entry in results.values())
+
+TARGETS = {
+    'fcfs': (ProcessTable.to_processes, lambda processes, tq: _legacy_events(processes, fcfs_scheduling(processes))),
+    'sjf': (ProcessTable.to_processes, lambda processes, tq: _legacy_events(processes, sjf_scheduling(processes))),
+    'rr': (ProcessTable.to_processes,
+           lambda processes, tq: _legacy_events(processes, round_robin_scheduling(processes, tq))),
+    'priority': (ProcessTable.to_processes,
+                 lambda processes, tq: _legacy_events(processes, priority_scheduling(processes))),
+    'srtf': (ProcessTable.to_processes, lambda processes, tq: _legacy_events(processes, srtf_scheduling(processes))),
+    'ppriority': (ProcessTable.to_processes,
+                  lambda processes, tq: _legacy_events(processes, preemptive_priority_scheduling(processes))),
+    'all': (_fresh_table, _run_all_events),
+}
+
+
+def measure(target, workload, table, repeat=3, time_quantum=DEFAULT_TIME_QUANTUM, memory=True):
+    """
+    Menjalankan satu target `repeat` kali pada tabel yang sama dan mengembalikan BenchmarkResult
+    (waktu terbaik dan median). Peak memory diukur pada run terpisah di bawah tracemalloc,
+    karena tracemalloc sendiri memperlambat eksekusi.
+    """
+    prepare, run = TARGETS[target]
+    timings = []
+    events = 0
+    for _ in range(repeat):
+        payload = prepare(table)
+        gc.collect()
+        start = time.perf_counter()
+        events = run(payload, time_quantum)
+        timings.append(time.perf_counter() - start)
+        del payload
+
+    peak_memory = None
+    if memory:
+        payload = prepare(table)
+        gc.collect()
+        tracemalloc.start()
+        run(payload, time_quantum)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        del payload
+
+    best = min(timings)
+    return BenchmarkResult(target, workload, len(table), best, statistics.median(timings), peak_memory,
+                           events, events / best if best > 0 else 0.0)
+
+def run_benchmarks(targets, workloads, scales, seed=0, repeat=3, time_quantum=DEFAULT_TIME_QUANTUM, memory=True):
+    """ Generator BenchmarkResult untuk setiap workload x jumlah job x target (workload dibuat sekali per skala). """
+    for workload in workloads:
+        for jobs in scales:
+            table = generate_workload(workload, jobs, seed)
+            for target in targets:
+                yield measure(target, workload, table, repeat, time_quantum, memory)
+
+
+# --- Baseline JSON ---
+def _git_commit():
+    """ Hash commit saat ini (jika dijalankan di dalam repositori git), untuk dicatat di baseline. """
+    try:
+        output = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+def save_baseline(results, path, seed, time_quantum):
+    """ Menyimpan hasil benchmark beserta info lingkungan (versi Python, NumPy, commit) ke file JSON. """
+    baseline = {
+        'version': BASELINE_VERSION,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__ if np is not None else None,
+        'seed': seed,
+        'time_quantum': time_quantum,
+        'results': [result._asdict() for result in results],
+    }
+    with open(path, 'w') as stream:
+        json.dump(baseline, stream, indent=2)
+
+def load_baseline(path):
+    """ Membaca file baseline JSON menjadi dictionary (target, workload, jobs) -> BenchmarkResult. """
+    with open(path) as stream:
+        baseline = json.load(stream)
+    if baseline.get('version') != BASELINE_VERSION:
+        raise ValueError(f"Versi baseline tidak didukung: {path}")
+    results = (BenchmarkResult(**entry) for entry in baseline['results'])
+    return {(result.target, result.workload, result.jobs): result for result in results}
+
+def compare(result, baseline, threshold=DEFAULT_REGRESSION_THRESHOLD):
+    """ Rasio waktu terhadap baseline (None jika tidak ada pembanding) dan apakah termasuk regresi. """
+    reference = baseline.get((result.target, result.workload, result.jobs))
+    if reference is None or reference.seconds <= 0:
+        return None, False
+    ratio = result.seconds / reference.seconds
+    return ratio, ratio > 1 + threshold
+
+
+# --- CLI ---
+def _parse_scale(text):
+    """ Parsing jumlah job dengan sufiks opsional: '500', '10k', '1M'. """
+    text = text.strip()
+    multiplier = {'k': 1000, 'm': 1000000}.get(text[-1:].lower(), 1)
+    if multiplier > 1:
+        text = text[:-1]
+    return int(float(text) * multiplier)
+
+def _parse_list(text, choices):
+    names = [name.strip() for name in text.split(',')]
+    for name in names:
+        if name not in choices:
+            raise argparse.ArgumentTypeError(f"pilihan tidak dikenal: {name} (tersedia: {', '.join(choices)})")
+    return names
+
+def _format_bytes(size):
+    if size is None:
+        return '-'
+    for unit in ('B', 'KiB', 'MiB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+def main(argv=None):
+    """ CLI benchmark: mencetak satu baris per hasil segera setelah diukur; keluar dengan kode 1 jika ada regresi. """
+    parser = argparse.ArgumentParser(description='Benchmark algoritma penjadwalan CPU pada workload sintetis.')
+    parser.add_argument('--targets', type=lambda text: _parse_list(text, TARGETS), default=list(TARGETS),
+                        help=f"Target dipisah koma: {','.join(TARGETS)} (fungsi API lama membuat satu objek Process per job)")
+    parser.add_argument('--workloads', type=lambda text: _parse_list(text, WORKLOADS), default=list(WORKLOADS),
+                        help=f"Workload dipisah koma: {','.join(WORKLOADS)}")
+    parser.add_argument('--scales', type=lambda text: [_parse_scale(part) for part in text.split(',')],
+                        default=[10, 1000, 100000], help="Jumlah job dipisah koma, misal '10,1k,100k,1M,10M'")
+    parser.add_argument('--seed', type=int, default=0, help='Seed generator workload')
+    parser.add_argument('--repeat', type=int, default=3, help='Jumlah pengulangan per pengukuran waktu')
+    parser.add_argument('--time-quantum', type=int, default=DEFAULT_TIME_QUANTUM, help='Time quantum Round Robin')
+    parser.add_argument('--no-memory', action='store_true', help='Lewati pengukuran peak memory (tracemalloc)')
+    parser.add_argument('--output', help='Simpan hasil sebagai baseline JSON')
+    parser.add_argument('--compare', help='Bandingkan dengan baseline JSON sebelumnya')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_REGRESSION_THRESHOLD,
+                        help='Batas perlambatan relatif yang dianggap regresi (default 0.10 = 10%%)')
+    args = parser.parse_args(argv)
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    print(f"{'Target':<10}{'Workload':<14}{'Jobs':>10}{'Time (s)':>12}{'Peak Mem':>12}{'Events/s':>14}{'vs Base':>10}")
+    results = []
+    regressions = 0
+    for result in run_benchmarks(args.targets, args.workloads, args.scales, args.seed, args.repeat,
+                                 args.time_quantum, not args.no_memory):
+        results.append(result)
+        ratio, regression = compare(result, baseline, args.threshold)
+        regressions += regression
+        versus = '-' if ratio is None else f"{ratio:.2f}x" + (' !' if regression else '')
+        print(f"{result.target:<10}{result.workload:<14}{result.jobs:>10}{result.seconds:>12.4f}"
+              f"{_format_bytes(result.peak_memory_bytes):>12}{result.events_per_second:>14.0f}{versus:>10}")
+        sys.stdout.flush()
+
+    if args.output:
+        save_baseline(results, args.output, args.seed, args.time_quantum)
+        print(f"Baseline disimpan ke {args.output}")
+    if regressions:
+        print(f"{regressions} pengukuran lebih lambat dari baseline (batas {args.threshold:.0%})")
+        return 1
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,319 @@
+# File gantt.py: Representasi Gantt chart yang ringkas (array-backed, run-length compressed)
+# Segmen disimpan sebagai kolom array (pid, start, end, idle) alih-alih list tuple Python,
+# segmen bersebelahan milik proses yang sama digabung, dan tersedia query rentang waktu
+# serta encoding JSON/biner agar renderer dan analitik cukup membaca jendela yang dibutuhkan.
+
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: hanya mempercepat GanttChart.from_columns
+    np = None
+
+# PID penanda segmen idle di Gantt chart (CPU tidak menjalankan proses apa pun)
+IDLE_PID = None
+
+# Encoding biner: header lalu kolom int64 little-endian pid, start, end, kemudian 1 byte flag idle per segmen
+GANTT_MAGIC = b'CPUGANTT'
+GANTT_VERSION = 1
+_HEADER = struct.Struct('<8sIQ')  # magic, versi, jumlah segmen
+
+
+# Jarak minimal antar label waktu (tick) pada sumbu Gantt chart, dalam piksel
+TICK_SPACING_PX = 60
+
+
+def nice_ticks(t0, t1, max_ticks):
+    """
+    Posisi tick "bagus" (kelipatan 1, 2, atau 5 x 10^k, minimal 1 satuan waktu) untuk rentang [t0, t1],
+    paling banyak sekitar `max_ticks` buah. Kepadatan tick dibatasi lebar piksel, bukan durasi.
+    Rentang yang tidak berhingga (inf/nan) tidak punya tick.
+    """
+    span = t1 - t0
+    if not math.isfinite(span):
+        return []
+    if span <= 0:
+        return [t0]
+    raw_step = span / max(1, max_ticks)
+    magnitude = 1
+    while magnitude * 10 <= raw_step:
+        magnitude *= 10
+    for factor in (1, 2, 5, 10):
+        step = magnitude * factor
+        if step >= raw_step:
+            break
+    first = math.ceil(t0 / step) * step
+    return list(range(first, math.floor(t1) + 1, step))
+
+
+def _widen(column, value):
+    """ Memperlebar kolom saat nilai baru tidak muat: array('q') -> array('d') -> list. """
+    if isinstance(column, array) and column.typecode == 'q' and isinstance(value, float):
+        return array('d', column)
+    return list(column)
+
+
+class GanttChart(Sequence):
+    """
+    Gantt chart satu CPU: urutan segmen (pid, start, end) yang tidak saling tumpang tindih.
+    Berperilaku seperti list tuple (iterasi, indeks, gantt[-1][2], len) sehingga template dan
+    kode lama tetap berjalan, tetapi disimpan sebagai kolom array dan otomatis digabung
+    (run-length) jika segmen baru melanjutkan segmen terakhir dari proses yang sama.
+    """
+
+    def __init__(self, segments=()):
+        self.pid = array('q')  # PID (0 untuk segmen idle; lihat kolom idle)
+        self.start = array('q')
+        self.end = array('q')
+        self.idle = bytearray()  # 1 jika segmen adalah CPU idle
+        for pid, start, end in segments:
+            self.add(pid, start, end)
+
+    # --- Penulisan ---
+    def add(self, pid, start, end):
+        """ Menambahkan segmen; digabung dengan segmen terakhir jika pid sama dan waktunya bersambung. """
+        is_idle = pid is IDLE_PID
+        if self.idle and self.idle[-1] == is_idle and self.end[-1] == start and (is_idle or self.pid[-1] == pid):
+            self._store('end', -1, end)
+            return
+        self.idle.append(is_idle)
+        for name, value in (('pid', 0 if is_idle else pid), ('start', start), ('end', end)):
+            column = getattr(self, name)
+            try:
+                column.append(value)
+            except (TypeError, OverflowError):
+                column = _widen(column, value)
+                column.append(value)
+                setattr(self, name, column)
+
+    def append(self, segment):
+        """ Kompatibel dengan list.append((pid, start, end)). """
+        self.add(*segment)
+
+    def extend(self, chart):
+        """
+        Menyambung Gantt chart lain di belakang chart ini. Segmen pertamanya digabung seperti add()
+        jika melanjutkan segmen terakhir; sisanya disalin per kolom tanpa loop Python per segmen.
+        """
+        if not len(chart):
+            return
+        self.add(*chart[0])
+        rest = chart[1:]
+        columns = [(getattr(self, name), getattr(rest, name)) for name in ('pid', 'start', 'end')]
+        if not all(isinstance(column, list) or (isinstance(values, array) and column.typecode == values.typecode)
+                   for column, values in columns):
+            for segment in rest:  # Tipe kolom berbeda: add() memperlebar kolom bila perlu
+                self.add(*segment)
+            return
+        for column, values in columns:
+            column.extend(values)
+        self.idle.extend(rest.idle)
+
+    def prefix(self, length, end):
+        """
+        Salinan `length` segmen pertama dengan segmen terakhir berakhir di `end`: bentuk Gantt chart
+        pada sebuah checkpoint mesin, sebelum segmen terakhir diperpanjang oleh eksekusi berikutnya.
+        """
+        chart = self[:length]
+        if length:
+            chart._store('end', -1, end)
+        return chart
+
+    def _store(self, name, index, value):
+        column = getattr(self, name)
+        try:
+            column[index] = value
+        except (TypeError, OverflowError):
+            column = _widen(column, value)
+            column[index] = value
+            setattr(self, name, column)
+
+    @classmethod
+    def from_columns(cls, pids, starts, ends, idle):
+        """
+        Membangun Gantt chart dari kolom yang sudah jadi (misal hasil FCFS tervektorisasi).
+        Segmen bersebelahan milik proses yang sama tetap digabung, sama seperti add().
+        """
+        chart = cls()
+        if np is None or not len(idle):
+            for pid, start, end, is_idle in zip(pids, starts, ends, idle):
+                chart.add(IDLE_PID if is_idle else pid, start, end)
+            return chart
+        pids, starts, ends = np.asarray(pids), np.asarray(starts), np.asarray(ends)
+        idle = np.asarray(idle, dtype=bool)
+        # Segmen i melanjutkan segmen i-1 jika jenisnya sama, pid sama, dan waktunya bersambung
+        continues = np.zeros(len(idle), dtype=bool)
+        continues[1:] = (idle[1:] == idle[:-1]) & (starts[1:] == ends[:-1]) & (idle[1:] | (pids[1:] == pids[:-1]))
+        heads = np.flatnonzero(~continues)
+        tails = np.append(heads[1:], len(idle)) - 1
+        chart.idle = bytearray(idle[heads].astype(np.uint8).tobytes())
+        for name, values in (('pid', np.where(idle, 0, pids)[heads]), ('start', starts[heads]), ('end', ends[tails])):
+            if values.dtype.kind in 'iu':
+                column = array('q')
+                column.frombytes(values.astype(np.int64).tobytes())
+            elif values.dtype.kind == 'f':
+                column = array('d')
+                column.frombytes(values.astype(np.float64).tobytes())
+            else:
+                column = values.tolist()
+            setattr(chart, name, column)
+        return chart
+
+    # --- Akses seperti list ---
+    def __len__(self):
+        return len(self.idle)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            chart = GanttChart()
+            chart.pid, chart.start, chart.end = self.pid[index], self.start[index], self.end[index]
+            chart.idle = self.idle[index]
+            return chart
+        return (IDLE_PID if self.idle[index] else self.pid[index], self.start[index], self.end[index])
+
+    def __iter__(self):
+        for pid, start, end, is_idle in zip(self.pid, self.start, self.end, self.idle):
+            yield (IDLE_PID if is_idle else pid, start, end)
+
+    def __eq__(self, other):
+        if isinstance(other, (GanttChart, list, tuple)):
+            return len(self) == len(other) and all(a == tuple(b) for a, b in zip(self, other))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"GanttChart({list(self)!r})"
+
+    # --- Query Rentang Waktu ---
+    def window(self, t0, t1):
+        """
+        Indeks (lo, hi) segmen yang tumpang tindih dengan [t0, t1). Segmen satu CPU terurut dan tidak
+        tumpang tindih, sehingga kolom start dan end sama-sama monoton: cukup dua binary search.
+        """
+        lo = bisect_right(self.end, t0)
+        hi = bisect_left(self.start, t1, lo)
+        return lo, hi
+
+    def overlapping(self, t0, t1):
+        """ Gantt chart berisi segmen yang tumpang tindih dengan [t0, t1) (tanpa memotong segmen). """
+        lo, hi = self.window(t0, t1)
+        return self[lo:hi]
+
+    def viewport(self, t0, t1, width=1000, max_rows=200):
+        """
+        Data siap gambar untuk jendela waktu [t0, t1) selebar `width` piksel: segmen dikelompokkan per PID
+        (baris idle terakhir), dipotong ke batas jendela, dan di-downsample dengan menggabungkan segmen
+        yang jaraknya tidak lebih dari satu piksel (resolusi = (t1 - t0) / width). Jumlah bar per baris
+        paling banyak sekitar `width`, berapa pun jumlah segmen aslinya.
+        """
+        lo, hi = self.window(t0, t1)
+        resolution = (t1 - t0) / width if width > 0 and t1 > t0 else 0
+        if np is not None and all(isinstance(column, array) for column in (self.pid, self.start, self.end)):
+            groups = self._downsample_numpy(lo, hi, t0, t1, resolution)
+        else:
+            groups = self._downsample_python(lo, hi, t0, t1, resolution)
+
+        pids = sorted((pid for pid in groups if pid is not IDLE_PID), key=lambda pid: (str(type(pid)), pid))
+        rows = [{'pid': pid, 'bars': groups[pid]} for pid in pids[:max_rows]]
+        if IDLE_PID in groups:
+            rows.append({'pid': IDLE_PID, 'bars': groups[IDLE_PID]})
+        return {
+            't0': t0, 't1': t1, 'resolution': resolution, 'makespan': self.makespan,
+            'segment_count': hi - lo, 'hidden_rows': max(0, len(pids) - max_rows),
+            'ticks': nice_ticks(t0, t1, max(2, width // TICK_SPACING_PX)), 'rows': rows,
+        }
+
+    def _downsample_python(self, lo, hi, t0, t1, resolution):
+        groups = {}
+        for index in range(lo, hi):
+            pid = IDLE_PID if self.idle[index] else self.pid[index]
+            start, end = max(self.start[index], t0), min(self.end[index], t1)
+            bars = groups.setdefault(pid, [])
+            if bars and start - bars[-1][1] <= resolution:
+                bars[-1][1] = end  # Jarak kurang dari satu piksel: gabung ke bar sebelumnya
+            else:
+                bars.append([start, end])
+        return groups
+
+    def _downsample_numpy(self, lo, hi, t0, t1, resolution):
+        if hi <= lo:
+            return {}
+        pid = np.asarray(self.pid[lo:hi])
+        idle = np.frombuffer(bytes(self.idle[lo:hi]), dtype=np.uint8).astype(bool)
+        start = np.maximum(np.asarray(self.start[lo:hi]), t0)
+        end = np.minimum(np.asarray(self.end[lo:hi]), t1)
+        pid = np.where(idle, 0, pid)
+
+        # Urutkan per kelompok (idle, pid) lalu start; segmen satu CPU tidak tumpang tindih,
+        # sehingga bar baru dimulai saat kelompok berganti atau ada jarak lebih dari satu piksel
+        order = np.lexsort((start, pid, idle))
+        pid, idle, start, end = pid[order], idle[order], start[order], end[order]
+        new_bar = np.ones(len(order), dtype=bool)
+        new_bar[1:] = (idle[1:] != idle[:-1]) | (pid[1:] != pid[:-1]) | (start[1:] - end[:-1] > resolution)
+        heads = np.flatnonzero(new_bar)
+        tails = np.append(heads[1:], len(order)) - 1
+
+        groups = {}
+        for bar_pid, is_idle, bar_start, bar_end in zip(pid[heads].tolist(), idle[heads].tolist(),
+                                                        start[heads].tolist(), end[tails].tolist()):
+            groups.setdefault(IDLE_PID if is_idle else bar_pid, []).append([bar_start, bar_end])
+        return groups
+
+    @property
+    def makespan(self):
+        """ Waktu akhir segmen terakhir (0 jika kosong). """
+        return self.end[-1] if len(self) else 0
+
+    # --- Encoding ---
+    def to_dict(self):
+        """ Encoding JSON kolumnar yang ringkas: {'pid': [...], 'start': [...], 'end': [...]}; pid idle = null. """
+        return {
+            'pid': [IDLE_PID if is_idle else pid for pid, is_idle in zip(self.pid, self.idle)],
+            'start': list(self.start),
+            'end': list(self.end),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """ Kebalikan dari to_dict(). """
+        return cls(zip(data['pid'], data['start'], data['end']))
+
+    def to_bytes(self):
+        """ Encoding biner (hanya untuk pid dan waktu integer): header + kolom int64 + flag idle. """
+        for column in (self.pid, self.start, self.end):
+            if not (isinstance(column, array) and column.typecode == 'q'):
+                raise ValueError("Encoding biner Gantt chart hanya mendukung pid dan waktu integer")
+        parts = [_HEADER.pack(GANTT_MAGIC, GANTT_VERSION, len(self))]
+        for column in (self.pid, self.start, self.end):
+            if np is not None:
+                parts.append(np.frombuffer(column, dtype=np.int64).astype('<i8', copy=False).tobytes())
+            else:
+                packed = array('q', column)
+                if sys.byteorder == 'big':
+                    packed.byteswap()
+                parts.append(packed.tobytes())
+        parts.append(bytes(self.idle))
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data):
+        """ Kebalikan dari to_bytes(). """
+        view = memoryview(data)
+        magic, version, count = _HEADER.unpack(view[:_HEADER.size])
+        if magic != GANTT_MAGIC or version != GANTT_VERSION:
+            raise ValueError(f"Bukan encoding Gantt chart versi {GANTT_VERSION}")
+        chart = cls()
+        offset = _HEADER.size
+        for name in ('pid', 'start', 'end'):
+            column = array('q')
+            column.frombytes(view[offset:offset + 8 * count])
+            if sys.byteorder == 'big':
+                column.byteswap()
+            setattr(chart, name, column)
+            offset += 8 * count
+        chart.idle = bytearray(view[offset:offset + count])
+        return chart
@@ -0,0 +1,144 @@
+# File incremental.py: Simulasi ulang inkremental saat workload diedit (proses ditambah, dihapus, atau diubah)
+# Mesin di scheduler.py menyimpan EngineCheckpoint (clock, ready queue, proses yang belum selesai) minimal setiap
+# CHECKPOINT_INTERVAL event, dengan jarak yang membesar mengikuti panjang ready queue dan total ukuran yang
+# dibatasi CHECKPOINT_BUDGET. Edit hanya memengaruhi jadwal sejak kedatangan paling awal yang berubah, jadi
+# setiap algoritma dilanjutkan dari checkpoint terakhir sebelum waktu itu: hasil proses yang sudah selesai dan
+# awalan Gantt chart disalin dari simulasi sebelumnya, dan hanya sisa jadwal yang disimulasikan ulang.
+
+import bisect
+
+from instrumentation import PROFILERS, EngineStats, profiled
+from scheduler import (ALGORITHMS, DEFAULT_TIME_QUANTUM, ProcessTable, ScheduleResult, _as_numpy,
+                       _build_result_entry, _run_engine, _typecode, count_context_switches, np)
+
+_COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority')
+
+
+class Simulation:
+    """
+    Hasil semua algoritma untuk satu workload beserta checkpoint mesinnya, sehingga bisa menjadi basis
+    simulasi ulang untuk versi workload berikutnya (lihat resimulate).
+        results     : {algoritma: entri seperti run_all_schedulers}
+        runs        : {algoritma: (ScheduleResult, Gantt chart, list EngineCheckpoint)}
+        resumed_from: {algoritma: waktu checkpoint tempat simulasi dilanjutkan, None jika dari awal}
+    """
+
+    def __init__(self, table, time_quantum=DEFAULT_TIME_QUANTUM, aging_interval=None):
+        self.table = table
+        self.time_quantum = time_quantum
+        self.aging_interval = aging_interval
+        self.results = {}
+        self.runs = {}
+        self.resumed_from = {}
+
+
+def first_difference(old_table, new_table):
+    """
+    Posisi kedatangan pertama di mana dua tabel berbeda (dibandingkan dalam urutan arrival_time), beserta
+    arrival time paling awal yang terpengaruh edit: min(arrival lama, arrival baru) pada posisi itu.
+    Semua proses yang tiba sebelum waktu tersebut identik (dan posisinya sama) di kedua tabel.
+    Mengembalikan (posisi, waktu), atau None jika kedua tabel berisi proses yang sama dengan urutan yang sama.
+    """
+    old_order, new_order = old_table.arrival_order(), new_table.arrival_order()
+    common = min(len(old_order), len(new_order))
+    typed = all(_typecode(getattr(table, name)) for table in (old_table, new_table) for name in _COLUMNS)
+    if np is not None and typed:
+        old_rows, new_rows = _as_numpy(old_order)[:common], _as_numpy(new_order)[:common]
+        differs = np.zeros(common, dtype=bool)
+        for name in _COLUMNS:
+            differs |= _as_numpy(getattr(old_table, name))[old_rows] != _as_numpy(getattr(new_table, name))[new_rows]
+        changed = np.flatnonzero(differs)
+        position = int(changed[0]) if len(changed) else common
+    else:
+        position = next((index for index in range(common)
+                         if any(getattr(old_table, name)[old_order[index]] != getattr(new_table, name)[new_order[index]]
+                                for name in _COLUMNS)), common)
+
+    arrivals = [table.arrival_time[order[position]] for table, order in ((old_table, old_order), (new_table, new_order))
+                if position < len(order)]
+    if not arrivals:
+        return None
+    return position, min(arrivals)
+
+
+def _copy_prefix(base, result, count):
+    """ Menyalin kolom hasil `count` posisi kedatangan pertama dari ScheduleResult lama ke yang baru. """
+    old_order, new_order = base.table.arrival_order(), result.table.arrival_order()
+    for name in ScheduleResult.COLUMNS:
+        source, target = getattr(base, name), getattr(result, name)
+        if np is not None and _typecode(source) and _typecode(target):
+            _as_numpy(target)[_as_numpy(new_order)[:count]] = _as_numpy(source)[_as_numpy(old_order)[:count]]
+        else:
+            for position in range(count):
+                target[new_order[position]] = source[old_order[position]]
+
+
+def _run(simulation, algorithm, instrument, base_run=None, affected=None):
+    """
+    Menjalankan satu algoritma untuk simulation.table dengan checkpoint. Jika ada `base_run` (hasil algoritma
+    yang sama pada workload sebelumnya), simulasi dilanjutkan dari checkpoint terakhir dengan horizon sebelum
+    `affected` (arrival paling awal yang berubah; None = tidak ada yang berubah).
+    """
+    table = simulation.table
+    stats = EngineStats(algorithm) if instrument else None
+    checkpoints, resume, result = [], None, None
+
+    if base_run is not None:
+        base_result, base_gantt, base_checkpoints = base_run
+        usable = len(base_checkpoints)
+        if affected is not None:
+            # Checkpoint terurut berdasarkan horizon: cari yang terakhir dengan horizon < affected
+            usable = bisect.bisect_left([checkpoint.horizon for checkpoint in base_checkpoints], affected)
+        if usable:
+            checkpoint = base_checkpoints[usable - 1]
+            checkpoints = base_checkpoints[:usable]
+            result = ScheduleResult(table)
+            _copy_prefix(base_result, result, checkpoint.next_arrival)
+            resume = (checkpoint, base_gantt.prefix(checkpoint.gantt_length, checkpoint.gantt_end))
+            simulation.resumed_from[algorithm] = checkpoint.time
+    simulation.resumed_from.setdefault(algorithm, None)
+
+    def run():
+        return _run_engine(table, algorithm, simulation.time_quantum, stats, simulation.aging_interval,
+                           checkpoints, resume, result)
+
+    if stats is None:
+        result, gantt_chart = run()
+    else:
+        with profiled(stats, instrument if instrument in PROFILERS else None):
+            with stats.phase('arrival_order'):
+                table.arrival_order()
+            with stats.phase('engine'):
+                result, gantt_chart = run()
+        stats.context_switches = count_context_switches(gantt_chart)
+    simulation.runs[algorithm] = (result, gantt_chart, checkpoints)
+    simulation.results[algorithm] = _build_result_entry(algorithm, result, gantt_chart, simulation.time_quantum, stats)
+
+
+def simulate(processes, time_quantum=DEFAULT_TIME_QUANTUM, aging_interval=None, instrument=None,
+             algorithms=ALGORITHMS):
+    """
+    Seperti run_all_schedulers (satu proses), tetapi mesin menyimpan checkpoint sehingga hasilnya bisa
+    menjadi basis resimulate. `processes` boleh berupa list objek Process atau ProcessTable.
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    simulation = Simulation(table, time_quantum, aging_interval)
+    for algorithm in algorithms:
+        _run(simulation, algorithm, instrument)
+    return simulation
+
+
+def resimulate(base, processes, instrument=None):
+    """
+    Simulasi workload hasil edit dari `base` (Simulation workload sebelumnya, dengan parameter yang sama).
+    Setiap algoritma dilanjutkan dari checkpoint terakhir sebelum arrival paling awal yang berubah, jadi
+    biayanya sebanding dengan bagian jadwal setelah edit, bukan panjang seluruh trace. Hasilnya identik
+    dengan simulate() pada workload baru.
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    difference = first_difference(base.table, table)
+    affected = None if difference is None else difference[1]
+    simulation = Simulation(table, base.time_quantum, base.aging_interval)
+    for algorithm in base.runs:
+        _run(simulation, algorithm, instrument, base.runs[algorithm], affected)
+    return simulation
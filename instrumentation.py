@@ -0,0 +1,133 @@
+# File instrumentation.py: Instrumentasi opsional untuk mesin penjadwalan (scheduler.py)
+# Mesin hanya mencatat counter jika diberi objek EngineStats (stats=None -> cukup satu pengecekan
+# `is not None` per dispatch), jadi biaya saat instrumentasi dimatikan hampir nol.
+# Hasil setiap run juga diakumulasi di `registry` untuk endpoint /metrics pada app.py.
+
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+# Profiler opsional yang bisa dinyalakan per run (selain counter dan timing fase)
+PROFILERS = ('cprofile', 'tracemalloc')
+# Jumlah fungsi teratas (berdasarkan waktu kumulatif) yang disimpan dari hasil cProfile
+PROFILE_TOP_FUNCTIONS = 15
+
+
+class EngineStats:
+    """ Counter dan timing satu run algoritma. Diisi oleh mesin di scheduler.py dan oleh _run_instrumented. """
+    __slots__ = ('algorithm', 'dispatches', 'quanta', 'preemptions', 'max_ready_queue', 'idle_jumps',
+                 'idle_time_skipped', 'context_switches', 'phases', 'profile', 'peak_memory_bytes')
+
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.dispatches = 0  # Berapa kali proses dipilih dan dijalankan di CPU
+        self.quanta = 0  # Round Robin: jumlah time quantum yang dijalankan (termasuk yang di-batch)
+        self.preemptions = 0  # SRTF/Priority Preemptive: berapa kali proses berjalan direbut proses lain
+        self.max_ready_queue = 0  # Jumlah proses siap terbanyak saat dispatch (termasuk yang dipilih)
+        self.idle_jumps = 0  # Berapa kali simulasi melompat ke kedatangan berikutnya saat CPU idle
+        self.idle_time_skipped = 0  # Total satuan waktu idle yang dilompati (tanpa iterasi per tick)
+        self.context_switches = 0
+        self.phases = {}  # Nama fase -> detik
+        self.profile = None  # Fungsi teratas dari cProfile, jika profiler 'cprofile' dinyalakan
+        self.peak_memory_bytes = None  # Peak memory dari tracemalloc, jika profiler 'tracemalloc' dinyalakan
+
+    def observe_ready_queue(self, depth):
+        if depth > self.max_ready_queue:
+            self.max_ready_queue = depth
+
+    def record_idle(self, start, end):
+        if end > start:
+            self.idle_jumps += 1
+            self.idle_time_skipped += end - start
+
+    @contextmanager
+    def phase(self, name):
+        """ Mengukur waktu satu fase (misal 'engine', 'metrics'); fase yang sama diakumulasi. """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@contextmanager
+def profiled(stats, profiler=None):
+    """ Menjalankan blok di bawah cProfile atau tracemalloc (sesuai `profiler`) dan menyimpan hasilnya ke stats. """
+    if profiler not in PROFILERS:
+        if profiler is not None:
+            raise ValueError(f"Profiler tidak dikenal: {profiler}")
+        yield
+        return
+
+    if profiler == 'cprofile':
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            stats.profile = _top_functions(profile)
+        return
+
+    already_tracing = tracemalloc.is_tracing()
+    if not already_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline = tracemalloc.get_traced_memory()[0]
+    try:
+        yield
+    finally:
+        stats.peak_memory_bytes = tracemalloc.get_traced_memory()[1] - baseline
+        if not already_tracing:
+            tracemalloc.stop()
+
+def _top_functions(profile, limit=PROFILE_TOP_FUNCTIONS):
+    """ Ringkasan cProfile: fungsi dengan waktu kumulatif terbesar, dalam bentuk list dictionary. """
+    rows = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in pstats.Stats(profile).stats.items():
+        rows.append({'function': f"{filename}:{line}({name})", 'calls': calls,
+                     'total_time': total, 'cumulative_time': cumulative})
+    rows.sort(key=lambda row: row['cumulative_time'], reverse=True)
+    return rows[:limit]
+
+
+class MetricsRegistry:
+    """ Akumulasi EngineStats per algoritma selama proses berjalan (thread-safe), untuk endpoint /metrics. """
+
+    COUNTERS = ('dispatches', 'quanta', 'preemptions', 'idle_jumps', 'idle_time_skipped', 'context_switches')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._algorithms = {}
+
+    def record(self, stats):
+        with self._lock:
+            totals = self._algorithms.setdefault(stats.algorithm, {
+                'runs': 0, 'max_ready_queue': 0, 'phase_seconds': {},
+                **{name: 0 for name in self.COUNTERS},
+            })
+            totals['runs'] += 1
+            for name in self.COUNTERS:
+                totals[name] += getattr(stats, name)
+            totals['max_ready_queue'] = max(totals['max_ready_queue'], stats.max_ready_queue)
+            for name, seconds in stats.phases.items():
+                totals['phase_seconds'][name] = totals['phase_seconds'].get(name, 0.0) + seconds
+
+    def snapshot(self):
+        """ Salinan total per algoritma: {algoritma: {runs, dispatches, ..., phase_seconds: {...}}}. """
+        with self._lock:
+            return {algorithm: dict(totals, phase_seconds=dict(totals['phase_seconds']))
+                    for algorithm, totals in self._algorithms.items()}
+
+    def reset(self):
+        with self._lock:
+            self._algorithms.clear()
+
+# Registry global: diisi setiap run yang diinstrumentasi (run_all_schedulers/run_scheduler dengan instrument)
+registry = MetricsRegistry()
@@ -0,0 +1,190 @@
+# File jobs.py: Eksekusi simulasi di latar belakang untuk API JSON (app.py)
+# Workload besar dijalankan di process pool terpisah dan diberi job id, sehingga satu simulasi berat
+# tidak memblokir thread request Flask dan tidak berebut GIL dengan pengguna interaktif.
+# Job murah (perkiraan biaya kecil) dijalankan langsung (inline) tetapi tetap dicatat sebagai job agar hasilnya
+# bisa di-page.
+
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from scheduler import (ALGORITHMS, DEFAULT_TIME_QUANTUM, ScheduleResult, _as_numpy, _build_result_entry,
+                       _run_engine, _typecode, count_context_switches, np)
+
+# Job dengan perkiraan biaya (jumlah event mesin, lihat estimate_cost) sampai batas ini dijawab langsung
+# di request; kira-kira 10.000 proses untuk keenam algoritma
+INLINE_JOB_LIMIT = 150000
+# Jumlah process worker untuk job latar belakang
+DEFAULT_JOB_WORKERS = 2
+# Jumlah job yang disimpan; job selesai yang paling lama dibuang lebih dulu
+DEFAULT_MAX_JOBS = 256
+
+# Status job
+QUEUED, RUNNING, DONE, FAILED = 'queued', 'running', 'done', 'failed'
+
+
+def estimate_cost(table, algorithms, time_quantum):
+    """
+    Perkiraan jumlah event (iterasi loop mesin) sebuah job. Mesin event-driven memproses sekitar satu
+    kedatangan dan satu penyelesaian per proses, kecuali Round Robin yang bisa butuh satu event per quantum:
+    paling banyak total burst / time_quantum + n. Jumlah proses saja tidak cukup, karena dua proses
+    dengan burst 10^9 dan quantum 1 sudah berarti 10^9 iterasi.
+    """
+    n = len(table)
+    cost = 2 * n * len(algorithms)
+    if 'Round Robin' in algorithms and n:
+        if np is not None and _typecode(table.burst_time):
+            total_burst = _as_numpy(table.burst_time).sum().item()
+        else:
+            total_burst = sum(table.burst_time)
+        cost += total_burst / time_quantum + n
+    return cost
+
+
+def _run_job(table, algorithms, time_quantum):
+    """ Tugas worker: jalankan algoritma yang diminta, kirim balik kolom hasil ringkas + Gantt chart. """
+    outputs = {}
+    for algorithm in algorithms:
+        result, gantt_chart = _run_engine(table, algorithm, time_quantum)
+        outputs[algorithm] = (result.columns(), gantt_chart)
+    return outputs
+
+
+class Job:
+    """ Satu permintaan simulasi: input (ProcessTable), parameter, status, dan hasil per algoritma. """
+
+    def __init__(self, table, algorithms, time_quantum):
+        self.id = uuid.uuid4().hex
+        self.table = table
+        self.algorithms = tuple(algorithms)
+        self.time_quantum = time_quantum
+        self.status = QUEUED
+        self.error = None
+        self.results = None  # {algorithm: entri seperti run_all_schedulers}, terisi saat DONE
+        self.cost = 0  # Perkiraan biaya (estimate_cost), diisi JobManager.submit
+        self._future = None
+
+    def _finish(self, outputs):
+        """
+        Menyusun entri hasil dari output worker (atau dari eksekusi inline). Context switch dihitung sekali
+        di sini (menelusuri seluruh Gantt chart), sehingga summary() untuk setiap polling status cukup membaca.
+        """
+        results = {}
+        for algorithm, (columns, gantt_chart) in outputs.items():
+            result = ScheduleResult(self.table, columns)
+            entry = _build_result_entry(algorithm, result, gantt_chart, self.time_quantum)
+            entry['context_switches'] = count_context_switches(gantt_chart)
+            results[algorithm] = entry
+        self.results = results
+        self.status = DONE
+
+    def _on_done(self, future):
+        """ Callback future process pool: simpan hasil atau pesan error. """
+        try:
+            self._finish(future.result())
+        except Exception as exc:  # Error worker dicatat di job, bukan dilempar ke thread pool
+            self.error = str(exc) or type(exc).__name__
+            self.status = FAILED
+
+    def summary(self):
+        """ Status job dan ringkasan metrik per algoritma (tanpa daftar proses) dalam bentuk dictionary. """
+        status = self.status
+        if status == QUEUED and self._future is not None and self._future.running():
+            status = RUNNING
+        summary = {'job_id': self.id, 'status': status, 'process_count': len(self.table),
+                   'algorithms': list(self.algorithms), 'time_quantum': self.time_quantum}
+        if self.error is not None:
+            summary['error'] = self.error
+        if self.results is not None:
+            summary['results'] = {
+                algorithm: {'avg_waiting_time': entry['avg_waiting_time'], 'metrics': entry['metrics'],
+                            'context_switches': entry['context_switches'],
+                            'gantt_segments': len(entry['gantt_chart'])}
+                for algorithm, entry in self.results.items()
+            }
+        return summary
+
+
+class JobManager:
+    """
+    Menyimpan job berdasarkan id dan menjalankannya: inline untuk job murah, atau di
+    ProcessPoolExecutor (dibuat saat pertama dibutuhkan) untuk job yang perkiraan biayanya besar.
+    """
+
+    def __init__(self, workers=DEFAULT_JOB_WORKERS, inline_limit=INLINE_JOB_LIMIT, max_jobs=DEFAULT_MAX_JOBS):
+        self.workers = workers
+        self.inline_limit = inline_limit
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def submit(self, table, algorithms=ALGORITHMS, time_quantum=DEFAULT_TIME_QUANTUM, inline_limit=None):
+        """
+        Membuat dan menjalankan job; mengembalikan Job (status DONE jika dijalankan inline).
+        `inline_limit` menggantikan batas self.inline_limit untuk job ini (sisa anggaran submit_batch).
+        """
+        for algorithm in algorithms:
+            if algorithm not in ALGORITHMS:
+                raise ValueError(f"Algoritma tidak dikenal: {algorithm}")
+        if time_quantum <= 0:
+            raise ValueError("Time quantum harus bilangan bulat positif")
+        job = Job(table, algorithms, time_quantum)
+        job.cost = estimate_cost(table, job.algorithms, time_quantum)
+        self._store(job)
+        if job.cost <= (self.inline_limit if inline_limit is None else inline_limit):
+            job._finish(_run_job(table, job.algorithms, time_quantum))
+            return job
+        table.arrival_order()  # Hitung urutan kedatangan sekali sebelum tabel dikirim ke worker
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            job._future = self._executor.submit(_run_job, table, job.algorithms, time_quantum)
+        job._future.add_done_callback(job._on_done)
+        return job
+
+    def submit_batch(self, requests):
+        """
+        Menjalankan banyak permintaan (table, algorithms, time_quantum) sebagai satu batch. Job dijalankan
+        inline hanya selama total perkiraan biaya job inline di batch ini masih dalam self.inline_limit;
+        sisanya ke process pool, jadi satu batch tidak memblokir thread request lebih lama dari satu job
+        inline. Permintaan yang berupa ValueError (gagal di-parse) diteruskan apa adanya.
+        Mengembalikan list berisi Job atau ValueError, satu per permintaan.
+        """
+        remaining = self.inline_limit
+        outcomes = []
+        for request in requests:
+            if isinstance(request, ValueError):
+                outcomes.append(request)
+                continue
+            try:
+                job = self.submit(*request, inline_limit=remaining)
+            except ValueError as exc:
+                outcomes.append(exc)
+                continue
+            if job._future is None:
+                remaining -= job.cost
+            outcomes.append(job)
+        return outcomes
+
+    def _store(self, job):
+        """ Menyimpan job baru; jika melebihi max_jobs, job selesai yang paling lama dibuang. """
+        with self._lock:
+            self._jobs[job.id] = job
+            if len(self._jobs) > self.max_jobs:
+                for job_id, old in list(self._jobs.items()):
+                    if old.status in (DONE, FAILED):
+                        del self._jobs[job_id]
+                        break
+
+    def get(self, job_id):
+        """ Job berdasarkan id, atau None jika tidak ada (atau sudah dibuang). """
+        return self._jobs.get(job_id)
+
+    def shutdown(self):
+        """ Menghentikan process pool (job yang sedang berjalan ditunggu sampai selesai). """
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
@@ -0,0 +1,234 @@
+# File multicore.py: Simulasi penjadwalan pada N core (multi-processor)
+# Dua mode antrian:
+#   - 'global'  : satu ready queue bersama; setiap core yang kosong mengambil proses terbaik dari sana.
+#   - 'per_core': setiap core punya ready queue sendiri (proses dibagi round-robin saat tiba); core yang
+#                 kosong boleh mencuri (work stealing) dari antrian terpanjang.
+# Simulasi event-driven: waktu hanya maju ke event kedatangan atau penyelesaian berikutnya, dan core
+# yang selesai diambil dari heap (waktu selesai, core), jadi biayanya O(n log n + n log cores),
+# tidak bergantung pada panjang waktu simulasi. Hasilnya satu Gantt chart (lane) per core.
+
+import argparse
+import heapq
+from array import array
+
+from gantt import GanttChart
+from scheduler import (ALGORITHM_ALIASES, ProcessTable, ScheduleResult, calculate_metrics, _record_idle,
+                       get_default_processes)
+
+MULTICORE_MODES = ('global', 'per_core')
+# Algoritma yang didukung (semuanya non-preemptive): nama -> kolom kunci seleksi (None = urutan kedatangan)
+MULTICORE_ALGORITHMS = {
+    'FCFS': None,
+    'SJF': 'burst_time',
+    'Priority Scheduling': 'priority',
+}
+
+
+class _CoreLanes:
+    """ Lane Gantt per core beserta waktu sibuk dan waktu akhir segmen terakhir setiap core. """
+
+    def __init__(self, cores):
+        self.charts = [GanttChart() for _ in range(cores)]
+        self.busy_time = [0] * cores
+        self.lane_end = [0] * cores
+        self.jobs = [0] * cores
+
+    def run(self, core, pid, start, end):
+        _record_idle(self.charts[core], self.lane_end[core], start)  # Core menganggur sampai proses ini mulai
+        self.charts[core].add(pid, start, end)
+        self.busy_time[core] += end - start
+        self.lane_end[core] = end
+        self.jobs[core] += 1
+
+
+def _multicore_engine(table, result, assigned_core, cores, selection_key=None, mode='global', steal=True):
+    """
+    Mesin event-driven multi-core untuk algoritma non-preemptive. Kunci ready queue adalah
+    (selection_key[baris], posisi kedatangan) seperti _non_preemptive_engine; FCFS memakai posisi saja.
+    Di setiap event: core yang selesai dibebaskan, proses yang tiba dimasukkan ke antrian, lalu core
+    yang kosong mengambil proses (mode per_core: dari antriannya sendiri, lalu mencuri jika `steal`).
+    Mengembalikan (_CoreLanes, jumlah steal).
+    """
+    pid, arrival, burst = table.pid, table.arrival_time, table.burst_time
+    start, completion = result.start_time, result.completion_time
+    turnaround, waiting = result.turnaround_time, result.waiting_time
+    order = table.arrival_order()
+    n = len(order)
+    per_core = mode == 'per_core'
+
+    lanes = _CoreLanes(cores)
+    running = []  # Heap (waktu selesai, core) untuk core yang sedang sibuk
+    idle = bytearray(b'\x01') * cores  # Flag core kosong
+    # Heap (sejak kapan kosong, core): core yang paling lama menganggur dipakai lebih dulu agar beban menyebar.
+    # Lazy: entri basi (core sudah sibuk lagi atau sudah punya entri lebih baru) dilewati.
+    idle_heap = [(0, core) for core in range(cores)]
+    queues = [[] for _ in range(cores)] if per_core else None  # Mode per_core: heap per core
+    global_queue = []  # Mode global: satu heap bersama
+    longest = []  # Mode per_core: max-heap lazy (-panjang antrian, core) untuk memilih korban steal
+    steals = 0
+    completed = 0
+    next_arrival = 0
+    current_time = arrival[order[0]] if n else 0
+
+    def dispatch(core, position, time):
+        row = order[position]
+        idle[core] = 0
+        start[row] = time
+        completion[row] = time + burst[row]
+        turnaround[row] = completion[row] - arrival[row]
+        waiting[row] = time - arrival[row]
+        assigned_core[row] = core
+        lanes.run(core, pid[row], time, completion[row])
+        heapq.heappush(running, (completion[row], core))
+
+    def pop_idle_core():
+        while idle_heap:
+            since, core = heapq.heappop(idle_heap)
+            if idle[core] and since == lanes.lane_end[core]:
+                return core
+        return None
+
+    def pop_queue(core):
+        _, position = heapq.heappop(queues[core])
+        heapq.heappush(longest, (-len(queues[core]), core))
+        return position
+
+    while completed < n:
+        # 1. Event penyelesaian: bebaskan core yang selesai pada current_time
+        freed = []
+        while running and running[0][0] <= current_time:
+            _, core = heapq.heappop(running)
+            idle[core] = 1
+            heapq.heappush(idle_heap, (lanes.lane_end[core], core))
+            freed.append(core)
+            completed += 1
+
+        # 2. Event kedatangan: masukkan proses yang sudah tiba ke antrian
+        while next_arrival < n and arrival[order[next_arrival]] <= current_time:
+            row = order[next_arrival]
+            key = (next_arrival if selection_key is None else selection_key[row], next_arrival)
+            if per_core:
+                core = next_arrival % cores  # Penempatan awal round-robin
+                heapq.heappush(queues[core], key)
+                heapq.heappush(longest, (-len(queues[core]), core))
+                if idle[core]:
+                    freed.append(core)
+            else:
+                heapq.heappush(global_queue, key)
+            next_arrival += 1
+
+        # 3. Dispatch: core kosong mengambil proses
+        if per_core:
+            for core in sorted(set(freed)):
+                if idle[core] and queues[core]:
+                    dispatch(core, pop_queue(core), current_time)
+            while steal:
+                # Curi dari antrian terpanjang (entri basi di heap `longest` dilewati)
+                while longest and -longest[0][0] != len(queues[longest[0][1]]):
+                    heapq.heappop(longest)
+                if not longest or longest[0][0] == 0:
+                    break
+                thief = pop_idle_core()
+                if thief is None:
+                    break
+                dispatch(thief, pop_queue(longest[0][1]), current_time)
+                steals += 1
+        else:
+            while global_queue:
+                core = pop_idle_core()
+                if core is None:
+                    break
+                _, position = heapq.heappop(global_queue)
+                dispatch(core, position, current_time)
+
+        # 4. Lompat ke event berikutnya: penyelesaian terdekat atau kedatangan berikutnya
+        next_times = []
+        if running:
+            next_times.append(running[0][0])
+        if next_arrival < n:
+            next_times.append(arrival[order[next_arrival]])
+        if not next_times:
+            break
+        current_time = min(next_times)
+
+    return lanes, steals
+
+
+def load_imbalance(busy_time):
+    """
+    Metrik ketidakseimbangan beban antar core dari total waktu sibuk per core:
+    rasio max/rata-rata (1.0 = seimbang sempurna) dan koefisien variasi.
+    """
+    cores = len(busy_time)
+    mean = sum(busy_time) / cores if cores else 0
+    if mean == 0:
+        return {'max_over_mean': 1.0, 'coefficient_of_variation': 0.0}
+    variance = sum((busy - mean) ** 2 for busy in busy_time) / cores
+    return {'max_over_mean': max(busy_time) / mean, 'coefficient_of_variation': variance ** 0.5 / mean}
+
+def simulate_multicore(processes, cores, algorithm='FCFS', mode='global', steal=True):
+    """
+    Menjalankan satu algoritma non-preemptive (FCFS, SJF, Priority Scheduling) pada `cores` core.
+    `processes` boleh berupa list objek Process atau ProcessTable. Mengembalikan dictionary:
+        processes    : view proses (seperti run_all_schedulers), dengan kolom `core` terpisah
+        core         : array core tempat setiap baris tabel dijalankan
+        gantt_charts : list GanttChart, satu lane per core
+        metrics      : metrik calculate_metrics (utilisasi dibagi jumlah core) ditambah utilisasi
+                       per core, jumlah job per core, ketidakseimbangan beban, dan jumlah steal
+    """
+    if algorithm not in MULTICORE_ALGORITHMS:
+        raise ValueError(f"Algoritma multi-core tidak dikenal: {algorithm}")
+    if mode not in MULTICORE_MODES:
+        raise ValueError(f"Mode multi-core tidak dikenal: {mode}")
+    if cores < 1:
+        raise ValueError("Jumlah core minimal 1")
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    result = ScheduleResult(table)
+    assigned_core = array('q', [0]) * len(table)
+    key_column = MULTICORE_ALGORITHMS[algorithm]
+    selection_key = getattr(table, key_column) if key_column else None
+    lanes, steals = _multicore_engine(table, result, assigned_core, cores, selection_key, mode, steal)
+
+    metrics = calculate_metrics(result)
+    makespan = metrics['makespan']
+    metrics['cpu_utilization'] = sum(lanes.busy_time) / (cores * makespan) if makespan > 0 else 0.0
+    metrics['per_core_utilization'] = [busy / makespan if makespan > 0 else 0.0 for busy in lanes.busy_time]
+    metrics['per_core_jobs'] = lanes.jobs
+    metrics['load_imbalance'] = load_imbalance(lanes.busy_time)
+    metrics['steals'] = steals
+    order = table.arrival_order() if algorithm == 'FCFS' else None
+    return {'processes': result.processes(order), 'core': assigned_core, 'gantt_charts': lanes.charts,
+            'avg_waiting_time': metrics['avg_waiting_time'], 'metrics': metrics,
+            'cores': cores, 'mode': mode, 'steal': steal and mode == 'per_core'}
+
+
+def main(argv=None):
+    """ CLI: `python multicore.py trace.bin --cores 64 --mode per_core` mencetak metrik dan utilisasi per core. """
+    parser = argparse.ArgumentParser(description='Simulasi penjadwalan CPU multi-core.')
+    parser.add_argument('trace', nargs='?', help='File trace CSV atau biner; default: data proses contoh')
+    parser.add_argument('--cores', type=int, default=4, help='Jumlah core')
+    parser.add_argument('--algorithm', default='fcfs', help='fcfs, sjf, atau priority')
+    parser.add_argument('--mode', choices=MULTICORE_MODES, default='global', help='Ready queue bersama atau per core')
+    parser.add_argument('--no-steal', action='store_true', help='Matikan work stealing (mode per_core)')
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        from trace_loader import load_trace
+        table = load_trace(args.trace)
+    else:
+        table = ProcessTable.from_processes(get_default_processes())
+    algorithm = ALGORITHM_ALIASES.get(args.algorithm.lower(), args.algorithm)
+    entry = simulate_multicore(table, args.cores, algorithm, args.mode, not args.no_steal)
+
+    metrics = entry['metrics']
+    print(f"{algorithm} pada {args.cores} core (mode {args.mode}, steal: {entry['steal']})")
+    print(f"Avg waiting time: {metrics['avg_waiting_time']:.2f}  p99: {metrics['p99_waiting_time']:.2f}  "
+          f"makespan: {metrics['makespan']}  utilisasi: {metrics['cpu_utilization']:.2%}")
+    print(f"Load imbalance (max/mean): {metrics['load_imbalance']['max_over_mean']:.3f}  "
+          f"CV: {metrics['load_imbalance']['coefficient_of_variation']:.3f}  steals: {metrics['steals']}")
+    print(f"{'Core':<6}{'Jobs':>10}{'Utilization':>14}")
+    for core, (jobs, utilization) in enumerate(zip(metrics['per_core_jobs'], metrics['per_core_utilization'])):
+        print(f"{core:<6}{jobs:>10}{utilization:>14.2%}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+# File result_cache.py: Cache hasil simulasi berbasis fingerprint workload (content-addressed)
+# Workload yang sama (proses + parameter algoritma) selalu menghasilkan jadwal yang sama,
+# jadi hasilnya cukup dihitung sekali. Cache dibatasi jumlah entri dengan kebijakan LRU.
+
+import hashlib
+import threading
+from array import array
+from collections import OrderedDict
+
+from scheduler import ProcessTable, _typecode
+
+# Jumlah entri default sebelum entri yang paling lama tidak dipakai dibuang
+DEFAULT_MAX_ENTRIES = 128
+
+
+def workload_fingerprint(processes, **params):
+    """
+    Hash kanonik (SHA-256 hex) dari sekumpulan proses beserta parameter algoritma (misal time_quantum).
+    Urutan baris ikut di-hash karena menentukan tie-break proses yang tiba bersamaan.
+    `processes` boleh berupa list objek Process atau ProcessTable; kolom bertipe di-hash langsung
+    dari byte-nya, sehingga fingerprint jutaan baris tidak membuat objek Python per baris.
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    digest = hashlib.sha256()
+    for column in (table.pid, table.arrival_time, table.burst_time, table.priority):
+        typecode = _typecode(column)
+        digest.update((typecode or 'list').encode())
+        if typecode:
+            digest.update(column if isinstance(column, array) or column.contiguous else bytes(column))
+        else:
+            digest.update(repr(column).encode())
+        digest.update(b'|')
+    digest.update(repr(sorted(params.items())).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """
+    Cache LRU thread-safe (aman untuk server Flask yang multi-thread) dengan penghitung hit/miss.
+    Nilai dihitung lewat get_or_compute; entri yang baru dipakai dipindah ke ujung antrean LRU.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError("max_entries minimal 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        """ Mengambil nilai (dan menandainya baru dipakai); menghitung hit/miss. """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """ Menyimpan nilai, membuang entri yang paling lama tidak dipakai jika melebihi batas. """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(self, key, compute):
+        """
+        Mengembalikan nilai ter-cache untuk key, atau memanggil compute() lalu menyimpannya.
+        compute() dijalankan di luar lock agar simulasi panjang tidak memblokir request lain.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = compute()
+        self.put(key, value)
+        return value
+
+    def clear(self):
+        """ Mengosongkan cache (penghitung hit/miss tidak di-reset). """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """ Ringkasan isi cache dan rasio hit dalam bentuk dictionary. """
+        lookups = self.hits + self.misses
+        return {
+            'entries': len(self._entries),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
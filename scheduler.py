@@ -1,7 +1,36 @@
 # File scheduler.py: Berisi implementasi algoritma penjadwalan CPU
 # Class Process dan fungsi-fungsi untuk FCFS, SJF, Round Robin, Priority Scheduling
 
+import argparse
+import bisect
+import csv
+import heapq
+import sys
+from array import array
+from collections import deque, namedtuple
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+try:
+    import numpy as np
+except ImportError:  # NumPy opsional: tanpa NumPy semua perhitungan memakai jalur Python murni
+    np = None
+
+# GanttChart: penyimpanan segmen berbasis array yang menggabungkan segmen bersebelahan (run-length)
+from gantt import IDLE_PID, GanttChart
+# Instrumentasi opsional (counter, timing fase, cProfile/tracemalloc) untuk mesin penjadwalan
+from instrumentation import PROFILERS, EngineStats, profiled, registry
+
+# Time quantum Round Robin yang dipakai run_all_schedulers dan CLI
+DEFAULT_TIME_QUANTUM = 2
+
 class Process:
+    # __slots__: tanpa __dict__ per objek, sehingga jutaan proses jauh lebih hemat memori
+    __slots__ = (
+        'pid', 'arrival_time', 'burst_time', 'priority',
+        'start_time', 'completion_time', 'turnaround_time', 'waiting_time',
+        'remaining_burst_time', 'last_execution_end_time', 'has_started',
+    )
 
     def __init__(self, pid, arrival_time, burst_time, priority=0):
         """
@@ -32,43 +61,513 @@ class Process:
         return Process(self.pid, self.arrival_time, self.burst_time, self.priority)
 
 
-# --- FCFS Scheduling (Non-Preemptive) ---
-def fcfs_scheduling(processes):
+# --- Tabel Proses Kolumnar (Struct-of-Arrays) ---
+def _column(values):
     """
-    Fungsi FCFS Scheduling: Implementasi First-Come, First-Served.
-    Prinsip: Proses dieksekusi berdasarkan urutan kedatangan - yang datang duluan, jalan duluan.
+    Mengemas satu kolom data ke array bertipe: 'q' (int64) jika semua nilai bulat,
+    'd' (float64) jika ada pecahan, dan list biasa untuk nilai lain (misal PID berupa string).
+    memoryview 'q'/'d' (misal hasil mmap file trace biner) dan array NumPy int64/float64
+    dipakai langsung tanpa salinan.
     """
-    # 1. Kunci Utama FCFS: Sort processes berdasarkan arrival time.
-    processes.sort(key=lambda x: x.arrival_time)
+    if isinstance(values, memoryview) and values.format in ('q', 'd'):
+        return values
+    if np is not None and isinstance(values, np.ndarray) and values.dtype in (np.int64, np.float64):
+        typecode = 'q' if values.dtype == np.int64 else 'd'
+        return memoryview(np.ascontiguousarray(values)).cast('B').cast(typecode)
+    if not isinstance(values, (list, tuple, array)):
+        values = list(values)
+    for typecode in ('q', 'd'):
+        try:
+            return array(typecode, values)
+        except (TypeError, OverflowError):
+            continue
+    return list(values)
+
+def _typecode(column):
+    """ Typecode kolom array/memoryview, atau None jika kolom berupa list biasa. """
+    if isinstance(column, array):
+        return column.typecode
+    if isinstance(column, memoryview):
+        return column.format
+    return None
+
+def _as_numpy(column):
+    """ View NumPy tanpa salinan (zero-copy) untuk kolom array/memoryview; kolom list dikonversi biasa. """
+    typecode = _typecode(column)
+    if typecode:
+        return np.frombuffer(column, dtype=np.int64 if typecode == 'q' else np.float64)
+    return np.asarray(column)
+
+def _index_array(indices):
+    """ Mengemas indeks baris (list atau hasil NumPy) ke array('q'). """
+    if np is not None and isinstance(indices, np.ndarray):
+        packed = array('q')
+        packed.frombytes(indices.astype(np.int64).tobytes())
+        return packed
+    return array('q', indices)
+
+
+class ProcessTable:
+    """
+    Tabel proses kolumnar: input pid, arrival_time, burst_time, dan priority disimpan
+    sebagai kolom array bertipe, bukan sebagai satu objek Process per job.
+    Setiap algoritma menulis hasilnya ke ScheduleResult (kolom hasil miliknya sendiri),
+    sehingga run_all_schedulers tidak perlu lagi menyalin seluruh daftar proses.
+    """
+
+    def __init__(self, pids, arrival_times, burst_times, priorities):
+        self.pid = _column(pids)
+        self.arrival_time = _column(arrival_times)
+        self.burst_time = _column(burst_times)
+        self.priority = _column(priorities)
+        if not len(self.pid) == len(self.arrival_time) == len(self.burst_time) == len(self.priority):
+            raise ValueError("Semua kolom ProcessTable harus memiliki panjang yang sama")
+        self._arrival_order = None
+
+    @classmethod
+    def from_processes(cls, processes):
+        """ Membangun tabel dari list objek Process (misal hasil parse_form_data). """
+        return cls([p.pid for p in processes], [p.arrival_time for p in processes],
+                   [p.burst_time for p in processes], [p.priority for p in processes])
+
+    @classmethod
+    def from_tuples(cls, process_data):
+        """ Membangun tabel dari data (pid, arrival_time, burst_time, priority). """
+        columns = tuple(zip(*process_data)) or ((), (), (), ())
+        return cls(*columns)
+
+    def __len__(self):
+        return len(self.pid)
+
+    def __getstate__(self):
+        """ memoryview (misal dari mmap) tidak bisa di-pickle: salin ke array saat dikirim ke worker. """
+        state = dict(self.__dict__)
+        for name, column in state.items():
+            if isinstance(column, memoryview):
+                packed = array(column.format)
+                packed.frombytes(column.cast('B'))
+                state[name] = packed
+        return state
+
+    @property
+    def time_typecode(self):
+        """ Typecode untuk kolom waktu hasil (start, completion, turnaround, waiting). """
+        typecodes = (_typecode(self.arrival_time), _typecode(self.burst_time))
+        if None in typecodes:
+            return None
+        return 'q' if typecodes == ('q', 'q') else 'd'
+
+    def arrival_order(self):
+        """ Indeks baris terurut berdasarkan arrival_time (sort stabil), dihitung sekali lalu di-cache. """
+        if self._arrival_order is None:
+            if np is not None and _typecode(self.arrival_time):
+                order = np.argsort(_as_numpy(self.arrival_time), kind='stable')
+            else:
+                order = sorted(range(len(self)), key=self.arrival_time.__getitem__)
+            self._arrival_order = _index_array(order)
+        return self._arrival_order
+
+    def to_processes(self):
+        """ Mengubah tabel kembali menjadi list objek Process (untuk form HTML dan API lama). """
+        return [Process(self.pid[row], self.arrival_time[row], self.burst_time[row], self.priority[row])
+                for row in range(len(self))]
+
+
+class ScheduleResult:
+    """ Kolom hasil satu algoritma (start, completion, turnaround, waiting) untuk sebuah ProcessTable. """
+
+    COLUMNS = ('start_time', 'completion_time', 'turnaround_time', 'waiting_time')
+
+    def __init__(self, table, columns=None):
+        """ `columns` opsional: kolom hasil yang sudah dihitung (misal dikirim balik dari worker process). """
+        self.table = table
+        if columns is None:
+            n = len(table)
+            typecode = table.time_typecode
+            columns = [array(typecode, [0]) * n if typecode else [0] * n for _ in self.COLUMNS]
+        self.start_time, self.completion_time, self.turnaround_time, self.waiting_time = columns
+
+    def columns(self):
+        """ Kolom hasil dalam bentuk ringkas (tanpa referensi ke tabel), untuk dikirim antar proses. """
+        return tuple(getattr(self, name) for name in self.COLUMNS)
+
+    def pid_order(self):
+        """ Indeks baris terurut berdasarkan PID (urutan tabel hasil SJF, RR, dan Priority). """
+        arrival_order = self.table.arrival_order()
+        if np is not None and _typecode(self.table.pid) and _typecode(self.completion_time):
+            # lexsort stabil: kunci utama PID, lalu completion_time, lalu urutan kedatangan
+            rows = _as_numpy(arrival_order)
+            order = rows[np.lexsort((_as_numpy(self.completion_time)[rows], _as_numpy(self.table.pid)[rows]))]
+        else:
+            order = sorted(arrival_order, key=lambda row: (self.table.pid[row], self.completion_time[row]))
+        return _index_array(order)
+
+    def processes(self, order=None):
+        """ Daftar view Process (lazy) dalam urutan baris `order`, default terurut berdasarkan PID. """
+        return ProcessViews(self, self.pid_order() if order is None else order)
+
+    def copy_to(self, processes):
+        """ Menyalin kolom hasil ke list objek Process yang barisnya sejajar dengan tabel. """
+        for row, process in enumerate(processes):
+            process.start_time = self.start_time[row]
+            process.completion_time = self.completion_time[row]
+            process.turnaround_time = self.turnaround_time[row]
+            process.waiting_time = self.waiting_time[row]
+
+
+class ProcessView:
+    """
+    View baca-saja ke satu baris ProcessTable + ScheduleResult dengan atribut yang sama
+    seperti Process, sehingga template dan kode lama tetap bisa memakai p.pid, p.waiting_time, dst.
+    """
+    __slots__ = ('_result', '_row')
+
+    def __init__(self, result, row):
+        self._result = result
+        self._row = row
+
+    pid = property(lambda self: self._result.table.pid[self._row])
+    arrival_time = property(lambda self: self._result.table.arrival_time[self._row])
+    burst_time = property(lambda self: self._result.table.burst_time[self._row])
+    priority = property(lambda self: self._result.table.priority[self._row])
+    start_time = property(lambda self: self._result.start_time[self._row])
+    completion_time = property(lambda self: self._result.completion_time[self._row])
+    turnaround_time = property(lambda self: self._result.turnaround_time[self._row])
+    waiting_time = property(lambda self: self._result.waiting_time[self._row])
+
+
+class ProcessViews(Sequence):
+    """ Sequence lazy berisi ProcessView: objek view hanya dibuat saat diakses/di-iterasi. """
+
+    def __init__(self, result, order):
+        self._result = result
+        self._order = order
 
-    current_time = 0  # Waktu simulasi saat ini
-    gantt_chart = []  # List untuk simpan data Gantt chart
+    def __len__(self):
+        return len(self._order)
 
-    for process in processes:
-        # 2. Tangani CPU Idle: Jika CPU selesai, tapi proses berikutnya belum tiba.
-        if current_time < process.arrival_time:
-            current_time = process.arrival_time  # Majukan waktu simulasi ke waktu kedatangan proses
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ProcessViews(self._result, self._order[index])
+        return ProcessView(self._result, self._order[index])
+
+
+# --- Checkpoint Mesin (untuk Simulasi Ulang Inkremental, lihat incremental.py) ---
+# Jumlah event minimum (iterasi loop utama mesin) antar checkpoint; FCFS: jumlah proses antar checkpoint
+CHECKPOINT_INTERVAL = 1024
+# Anggaran memori checkpoint satu run mesin: total entri ready queue + state proses di semua checkpoint
+CHECKPOINT_BUDGET = 1 << 17
+
+class EngineCheckpoint:
+    """
+    Snapshot state mesin pada batas event: di awal satu iterasi loop utama, sebelum proses yang tiba
+    pada `time` dimasukkan ke ready queue. Semua state memakai posisi kedatangan (bukan baris tabel),
+    sehingga checkpoint tetap berlaku untuk tabel hasil edit selama proses yang tiba sampai `horizon`
+    tidak berubah: mesin bisa dilanjutkan dari sini tanpa mengulang event sebelumnya.
+        time         : waktu simulasi (clock)
+        horizon      : state hanya bergantung pada proses dengan arrival <= horizon
+        next_arrival : posisi kedatangan berikutnya yang belum masuk ready queue
+        completed    : jumlah proses yang sudah selesai
+        gantt_length : jumlah segmen Gantt chart; gantt_end: waktu akhir segmen terakhir saat itu
+        ready        : salinan ready queue (isi heap atau antrian posisi)
+        in_flight    : {posisi: state per proses} untuk proses yang sudah tiba tetapi belum selesai
+        running      : mesin preemptive: (posisi, nilai pembanding, waktu dispatch) proses berjalan, atau None
+    """
+    __slots__ = ('time', 'horizon', 'next_arrival', 'completed', 'gantt_length', 'gantt_end',
+                 'ready', 'in_flight', 'running')
+
+    def __init__(self, time, next_arrival, completed, gantt_chart, ready=(), in_flight=None, running=None,
+                 horizon=None):
+        self.time = time
+        self.horizon = time if horizon is None else horizon
+        self.next_arrival = next_arrival
+        self.completed = completed
+        self.gantt_length = len(gantt_chart)
+        self.gantt_end = gantt_chart.end[-1] if len(gantt_chart) else 0
+        self.ready = list(ready)
+        self.in_flight = in_flight or {}
+        self.running = running
+
+    def entries(self):
+        """ Ukuran checkpoint untuk anggaran memori: isi ready queue ditambah state per proses. """
+        return len(self.ready) + len(self.in_flight)
+
+
+class _CheckpointLog:
+    """
+    Mencatat checkpoint satu run mesin ke list `checkpoints` dalam anggaran memori tetap. Menyalin ready
+    queue sebanding dengan panjangnya, jadi checkpoint berikutnya baru diambil setelah minimal sebanyak
+    max(interval, entri checkpoint terakhir) event: total salinan tidak melebihi jumlah event, juga saat
+    ready queue menumpuk pada trace overload. Jika total entri melewati CHECKPOINT_BUDGET, setiap checkpoint
+    kedua dibuang dan interval digandakan; checkpoint pertama selalu dipertahankan.
+    """
+
+    def __init__(self, checkpoints, resume=None):
+        self.checkpoints = checkpoints
+        self.interval = CHECKPOINT_INTERVAL
+        self.entries = sum(checkpoint.entries() for checkpoint in checkpoints)
+        # Checkpoint tempat run dilanjutkan sudah tercatat di list (awalan checkpoint run sebelumnya)
+        self.next_event = 0 if resume is None else max(self.interval, resume[0].entries())
+
+    def add(self, events, checkpoint):
+        """ Menyimpan checkpoint yang diambil pada event ke-`events` dan menjadwalkan checkpoint berikutnya. """
+        self.checkpoints.append(checkpoint)
+        size = checkpoint.entries()
+        self.entries += size
+        while self.entries > CHECKPOINT_BUDGET and len(self.checkpoints) > 1:
+            del self.checkpoints[1::2]
+            self.entries = sum(kept.entries() for kept in self.checkpoints)
+            self.interval *= 2
+        self.next_event = events + max(self.interval, size)
+
+
+# --- Mesin FCFS (Kolumnar) ---
+def _fcfs_engine(table, result, stats=None, checkpoints=None, resume=None):
+    """
+    Menjalankan FCFS di atas ProcessTable, menulis ke kolom `result`, dan mengembalikan Gantt chart.
+    FCFS tidak punya ready queue, jadi checkpoint cukup (posisi, clock) dan dihitung dari hasil setelah run.
+    `resume` = (EngineCheckpoint, awalan Gantt chart) melanjutkan dari posisi checkpoint.
+    """
+    first, current_time, gantt_chart = 0, 0, None
+    if resume is not None:
+        checkpoint, gantt_chart = resume
+        first, current_time = checkpoint.next_arrival, checkpoint.time
+    # Jalur NumPy hanya untuk kolom waktu integer, agar hasilnya identik bit-per-bit dengan jalur Python
+    if np is not None and table.time_typecode == 'q':
+        suffix = _fcfs_engine_numpy(table, result, first, current_time)
+    else:
+        suffix = _fcfs_engine_python(table, result, first, current_time)
+    first_segment = 0
+    if gantt_chart is None:
+        gantt_chart = suffix
+    else:
+        first_segment = len(gantt_chart)
+        gantt_chart.extend(suffix)
+    if stats is not None:
+        _fcfs_stats(table, result, gantt_chart, stats, first, first_segment)
+    if checkpoints is not None:
+        _fcfs_checkpoints(table, result, gantt_chart, checkpoints, first)
+    return gantt_chart
+
+def _fcfs_checkpoints(table, result, gantt_chart, checkpoints, first=0):
+    """
+    Checkpoint FCFS setiap CHECKPOINT_INTERVAL posisi setelah `first`: sebelum posisi p, clock adalah
+    completion proses p-1 dan state hanya bergantung pada proses sampai posisi p-1. Segmen Gantt chart
+    dari posisi >= p dimulai paling cepat pada clock itu, jadi awalannya adalah segmen yang mulai sebelumnya.
+    """
+    order = table.arrival_order()
+    for position in range(first + CHECKPOINT_INTERVAL, len(order), CHECKPOINT_INTERVAL):
+        row = order[position - 1]
+        if table.burst_time[row] <= 0:
+            continue  # Segmen nol-durasi tidak bisa dipisahkan dari awalan berdasarkan waktu mulai
+        time = result.completion_time[row]
+        checkpoint = EngineCheckpoint(time, position, position, GanttChart(), horizon=table.arrival_time[row])
+        checkpoint.gantt_length = bisect.bisect_left(gantt_chart.start, time)
+        checkpoint.gantt_end = time
+        checkpoints.append(checkpoint)
+
+def _fcfs_stats(table, result, gantt_chart, stats, first=0, first_segment=0):
+    """
+    Counter instrumentasi FCFS, dihitung dari hasil karena kedua jalur FCFS tidak memakai ready queue
+    eksplisit: proses siap saat dispatch ke-i = proses yang sudah tiba pada start time-nya dikurangi i.
+    Run yang dilanjutkan dari checkpoint hanya menghitung posisi mulai `first` dan segmen mulai `first_segment`.
+    """
+    order = table.arrival_order()
+    stats.dispatches += len(order) - first
+    for index, is_idle in enumerate(gantt_chart.idle[first_segment:], first_segment):
+        if is_idle:
+            stats.record_idle(gantt_chart.start[index], gantt_chart.end[index])
+    if len(order) <= first:
+        return
+    if np is not None and _typecode(table.arrival_time) and _typecode(result.start_time):
+        rows = _as_numpy(order)
+        arrived = np.searchsorted(_as_numpy(table.arrival_time)[rows], _as_numpy(result.start_time)[rows[first:]],
+                                  side='right')
+        stats.observe_ready_queue(int((arrived - np.arange(first, len(rows))).max()))
+        return
+    arrivals = [table.arrival_time[row] for row in order]
+    for position in range(first, len(order)):
+        stats.observe_ready_queue(bisect.bisect_right(arrivals, result.start_time[order[position]]) - position)
+
+def _fcfs_engine_python(table, result, first=0, current_time=0):
+    """
+    Implementasi referensi FCFS (loop Python murni), dipakai juga untuk uji kesetaraan jalur NumPy.
+    `first` dan `current_time`: mulai dari posisi kedatangan tertentu dengan clock tertentu (resume).
+    """
+    pid, arrival, burst = table.pid, table.arrival_time, table.burst_time
+    start, completion = result.start_time, result.completion_time
+    turnaround, waiting = result.turnaround_time, result.waiting_time
 
-        # 3. Eksekusi Proses: Non-preemptive, proses berjalan sampai selesai.
-        process.start_time = current_time
-        process.completion_time = process.start_time + process.burst_time
-        
-        # 4. Hitung Metrik: Rumus dasar CPU Scheduling
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
+    gantt_chart = GanttChart()  # Penyimpanan segmen Gantt chart
 
-        gantt_chart.append((process.pid, current_time, process.completion_time))
-        current_time = process.completion_time  # Update current time
+    # Kunci Utama FCFS: Proses dieksekusi sesuai urutan arrival time
+    for row in table.arrival_order()[first:]:
+        # Tangani CPU Idle: Jika CPU selesai, tapi proses berikutnya belum tiba.
+        if current_time < arrival[row]:
+            _record_idle(gantt_chart, current_time, arrival[row])
+            current_time = arrival[row]  # Majukan waktu simulasi ke waktu kedatangan proses
 
+        # Eksekusi Proses: Non-preemptive, proses berjalan sampai selesai.
+        start[row] = current_time
+        completion[row] = current_time + burst[row]
+
+        # Hitung Metrik: Rumus dasar CPU Scheduling
+        turnaround[row] = completion[row] - arrival[row]
+        waiting[row] = turnaround[row] - burst[row]
+
+        gantt_chart.add(pid[row], current_time, completion[row])
+        current_time = completion[row]  # Update current time
+
+    return gantt_chart
+
+
+def _fcfs_engine_numpy(table, result, first=0, current_time=0):
+    """
+    FCFS tervektorisasi. Completion adalah prefix computation:
+        completion[i] = max(arrival[i], completion[i-1]) + burst[i],  completion[-1] = c0
+    yang ekuivalen dengan bentuk tertutup
+        completion[i] = S[i] + max(c0, max_{j<=i}(arrival[j] - S[j-1])),  S = cumsum(burst)
+    sehingga bisa dihitung dengan cumsum + maximum.accumulate tanpa loop Python.
+    c0 = current_time adalah clock awal (0, atau clock checkpoint saat resume dari posisi `first`).
+    """
+    rows = _as_numpy(table.arrival_order())[first:]
+    arrival = _as_numpy(table.arrival_time)[rows]
+    burst = _as_numpy(table.burst_time)[rows]
+
+    prefix_burst = np.cumsum(burst)
+    slack = np.maximum.accumulate(arrival - (prefix_burst - burst))
+    completion = prefix_burst + np.maximum(slack, current_time)
+    start = completion - burst
+
+    # Tulis langsung ke kolom hasil lewat view zero-copy
+    _as_numpy(result.start_time)[rows] = start
+    _as_numpy(result.completion_time)[rows] = completion
+    _as_numpy(result.turnaround_time)[rows] = completion - arrival
+    _as_numpy(result.waiting_time)[rows] = start - arrival
+
+    # Gantt chart: segmen idle disisipkan sebelum proses yang mulai setelah CPU menganggur
+    previous_end = np.concatenate(([current_time], completion[:-1]))
+    idle_before = start > previous_end
+    shift = np.cumsum(idle_before)
+    size = len(rows) + int(shift[-1]) if len(rows) else 0
+    pids = _as_numpy(table.pid)[rows] if _typecode(table.pid) else np.array([table.pid[row] for row in rows.tolist()], dtype=object)
+    segment_pid = np.zeros(size, dtype=pids.dtype)
+    segment_start = np.empty(size, dtype=np.int64)
+    segment_end = np.empty(size, dtype=np.int64)
+    segment_idle = np.zeros(size, dtype=bool)
+
+    process_slot = np.arange(len(rows)) + shift
+    segment_pid[process_slot] = pids
+    segment_start[process_slot] = start
+    segment_end[process_slot] = completion
+
+    idle_slot = process_slot[idle_before] - 1
+    segment_idle[idle_slot] = True
+    segment_start[idle_slot] = previous_end[idle_before]
+    segment_end[idle_slot] = start[idle_before]
+
+    return GanttChart.from_columns(segment_pid, segment_start, segment_end, segment_idle)
+
+
+# --- FCFS Scheduling (Non-Preemptive) ---
+def fcfs_scheduling(processes):
+    """
+    Fungsi FCFS Scheduling: Implementasi First-Come, First-Served.
+    Prinsip: Proses dieksekusi berdasarkan urutan kedatangan - yang datang duluan, jalan duluan.
+    """
+    # Sort processes berdasarkan arrival time, lalu jalankan mesin kolumnar
+    processes.sort(key=lambda x: x.arrival_time)
+    table = ProcessTable.from_processes(processes)
+    result = ScheduleResult(table)
+    gantt_chart = _fcfs_engine(table, result)
+    result.copy_to(processes)
     return processes, gantt_chart
 
 
 # --- Fungsi Bantuan ---
+def _record_idle(gantt_chart, start, end):
+    """ Mencatat segmen idle secara eksplisit di Gantt chart agar waktu CPU menganggur terlihat. """
+    if end > start:
+        gantt_chart.add(IDLE_PID, start, end)
+
 def calculate_average_waiting_time(processes):
     """ Menghitung Rata-rata Waktu Tunggu dari seluruh proses. """
     total_waiting_time = sum(p.waiting_time for p in processes)
     return total_waiting_time / len(processes)
 
+# Persentil yang dilaporkan oleh calculate_metrics
+METRIC_PERCENTILES = (50, 95, 99)
+
+def _percentiles_python(values, percentiles):
+    """ Persentil dengan interpolasi linear (sama dengan default numpy.percentile), Python murni. """
+    ordered = sorted(values)
+    last = len(ordered) - 1
+    output = []
+    for q in percentiles:
+        rank = q / 100 * last
+        low = int(rank)
+        high = min(low + 1, last)
+        output.append(ordered[low] + (ordered[high] - ordered[low]) * (rank - low))
+    return output
+
+def calculate_metrics(result):
+    """
+    Tahap metrik tervektorisasi untuk hasil algoritma apa pun (ScheduleResult):
+    rata-rata dan persentil (p50/p95/p99) waiting & turnaround time, throughput, dan utilisasi CPU.
+    Memakai NumPy jika tersedia (jutaan job dalam hitungan milidetik), jika tidak memakai Python murni.
+    Rentang waktu diukur dari kedatangan pertama sampai penyelesaian terakhir.
+    """
+    table = result.table
+    n = len(table)
+    metrics = {'count': n}
+    if n == 0:
+        for name in ('waiting', 'turnaround'):
+            metrics[f'avg_{name}_time'] = 0.0
+            metrics.update({f'p{q}_{name}_time': 0.0 for q in METRIC_PERCENTILES})
+        metrics.update(makespan=0, throughput=0.0, cpu_utilization=0.0)
+        return metrics
+
+    if np is not None:
+        columns = {'waiting': _as_numpy(result.waiting_time), 'turnaround': _as_numpy(result.turnaround_time)}
+        for name, values in columns.items():
+            metrics[f'avg_{name}_time'] = float(values.sum() / n)
+            for q, value in zip(METRIC_PERCENTILES, np.percentile(values, METRIC_PERCENTILES)):
+                metrics[f'p{q}_{name}_time'] = float(value)
+        first_arrival = _as_numpy(table.arrival_time).min().item()
+        last_completion = _as_numpy(result.completion_time).max().item()
+        total_burst = _as_numpy(table.burst_time).sum().item()
+    else:
+        columns = {'waiting': result.waiting_time, 'turnaround': result.turnaround_time}
+        for name, values in columns.items():
+            metrics[f'avg_{name}_time'] = sum(values) / n
+            for q, value in zip(METRIC_PERCENTILES, _percentiles_python(values, METRIC_PERCENTILES)):
+                metrics[f'p{q}_{name}_time'] = value
+        first_arrival = min(table.arrival_time)
+        last_completion = max(result.completion_time)
+        total_burst = sum(table.burst_time)
+
+    makespan = last_completion - first_arrival
+    metrics['makespan'] = makespan
+    metrics['throughput'] = n / makespan if makespan > 0 else 0.0  # Jumlah proses selesai per satuan waktu
+    metrics['cpu_utilization'] = total_burst / makespan if makespan > 0 else 0.0  # Fraksi waktu CPU sibuk
+    return metrics
+
+def count_context_switches(gantt_chart):
+    """ Menghitung context switch: berapa kali CPU berpindah ke proses lain (segmen idle diabaikan). """
+    switches = 0
+    previous_pid = IDLE_PID
+    for pid, start, end in gantt_chart:
+        if pid is IDLE_PID:
+            continue
+        if previous_pid is not IDLE_PID and pid != previous_pid:
+            switches += 1
+        previous_pid = pid
+    return switches
+
+def _gantt_label(pid):
+    """ Label segmen Gantt chart: 'P<pid>' untuk proses, 'IDLE' untuk CPU menganggur. """
+    return "IDLE" if pid is IDLE_PID else f"P{pid}"
+
 def display_gantt_chart(gantt_chart):
     """
     Menampilkan Gantt chart dalam format teks sederhana (CLI).
@@ -78,148 +577,253 @@ def display_gantt_chart(gantt_chart):
     header = "|"
     for item in gantt_chart:
         pid, start, end = item
-        header += f" P{pid} |"
+        header += f" {_gantt_label(pid)} |"
     print(header)
 
     times = str(gantt_chart[0][1])
     for item in gantt_chart:
         pid, start, end = item
         # Menghitung padding agar angka waktu sejajar di bawah bar proses
-        padding = (len(f" P{pid} ") - len(str(end)))
+        padding = (len(f" {_gantt_label(pid)} ") - len(str(end)))
         times += " " * padding + str(end)
     print(times)
 
 
-# --- SJF Scheduling (Non-Preemptive) ---
-def sjf_scheduling(processes):
+# --- Mesin Event-Driven untuk Algoritma Non-Preemptive ---
+def _non_preemptive_engine(table, result, selection_key, stats=None, checkpoints=None, resume=None):
     """
-    Implementasi algoritma Shortest Job First (SJF) Non-Preemptive.
-    Prinsip: Di antara proses yang sudah tiba (available), pilih yang waktu burst-nya terpendek.
+    Mesin bersama untuk SJF dan Priority Scheduling (Non-Preemptive) di atas ProcessTable.
+    Proses yang tiba dimasukkan dari kursor (urut arrival time) ke min-heap dengan kunci
+    (selection_key[baris], urutan kedatangan), sehingga setiap dispatch cukup O(log n).
+    Urutan kedatangan sebagai tie-breaker membuat hasilnya sama persis dengan sort stabil
+    pada daftar proses yang tersedia (perilaku implementasi sebelumnya).
+    `checkpoints` (list) diisi EngineCheckpoint lewat _CheckpointLog (minimal setiap CHECKPOINT_INTERVAL
+    event, dalam anggaran CHECKPOINT_BUDGET); `resume` =
+    (EngineCheckpoint, awalan Gantt chart) melanjutkan simulasi dari checkpoint tersebut.
     """
-    processes.sort(key=lambda x: x.arrival_time)  # Urutkan berdasarkan waktu kedatangan
-    current_time = 0
-    completed_processes = []
-    gantt_chart = []
-    n = len(processes)
-    is_completed = [False] * n
-
-    while len(completed_processes) < n:
-        # 1. Identifikasi Proses yang Sudah Tersedia (Available Processes)
-        available_processes = []
-        for i in range(n):
-            if processes[i].arrival_time <= current_time and not is_completed[i]:
-                available_processes.append(processes[i])
-
-        if not available_processes:
-            # 2. CPU Idle: Tidak ada proses tersedia, majukan waktu
-            current_time += 1
+    pid, arrival, burst = table.pid, table.arrival_time, table.burst_time
+    start, completion = result.start_time, result.completion_time
+    turnaround, waiting = result.turnaround_time, result.waiting_time
+    order = table.arrival_order()
+    n = len(order)
+
+    if resume is None:
+        current_time = 0
+        gantt_chart = GanttChart()
+        completed = 0
+        ready_heap = []  # Min-heap berisi (kunci seleksi, posisi kedatangan)
+        next_arrival = 0  # Kursor ke proses berikutnya yang belum tiba
+    else:
+        checkpoint, gantt_chart = resume
+        current_time, completed, next_arrival = checkpoint.time, checkpoint.completed, checkpoint.next_arrival
+        ready_heap = list(checkpoint.ready)
+    log = None if checkpoints is None else _CheckpointLog(checkpoints, resume)
+    events = 0
+
+    while completed < n:
+        if log is not None:
+            if events >= log.next_event:
+                log.add(events, EngineCheckpoint(current_time, next_arrival, completed, gantt_chart, ready_heap))
+            events += 1
+
+        # 1. Masukkan Proses Tiba: Semua proses dengan arrival_time <= current_time masuk ke heap
+        while next_arrival < n and arrival[order[next_arrival]] <= current_time:
+            heapq.heappush(ready_heap, (selection_key[order[next_arrival]], next_arrival))
+            next_arrival += 1
+
+        if not ready_heap:
+            # 2. CPU Idle: Lompat langsung ke waktu kedatangan proses berikutnya
+            next_arrival_time = arrival[order[next_arrival]]
+            _record_idle(gantt_chart, current_time, next_arrival_time)
+            if stats is not None:
+                stats.record_idle(current_time, next_arrival_time)
+            current_time = next_arrival_time
             continue
 
-        # 3. Kunci Utama SJF: Pilih proses dengan waktu burst terpendek
-        available_processes.sort(key=lambda x: x.burst_time)
-        shortest_job = available_processes[0]
+        # 3. Dispatch: Ambil proses dengan kunci terkecil dari heap
+        if stats is not None:
+            stats.dispatches += 1
+            stats.observe_ready_queue(len(ready_heap))
+        _, position = heapq.heappop(ready_heap)
+        row = order[position]
+
+        # 4. Eksekusi Proses: Non-preemptive, berjalan sampai selesai
+        start[row] = current_time
+        completion[row] = current_time + burst[row]
+        turnaround[row] = completion[row] - arrival[row]
+        waiting[row] = turnaround[row] - burst[row]
 
-        # Temukan indeks proses yang dipilih di daftar proses asli
-        shortest_job_index = -1
-        for i in range(n):
-            if processes[i].pid == shortest_job.pid and not is_completed[i]:
-                shortest_job_index = i
-                break
+        gantt_chart.add(pid[row], current_time, completion[row])
+        current_time = completion[row]
+        completed += 1
 
-        process = processes[shortest_job_index]
+    return gantt_chart
 
-        # 4. Eksekusi Proses: Non-preemptive, berjalan sampai selesai
-        process.start_time = current_time
-        process.completion_time = process.start_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
 
-        gantt_chart.append((process.pid, current_time, process.completion_time))
-        current_time = process.completion_time
-        is_completed[shortest_job_index] = True
-        completed_processes.append(process)
+def _non_preemptive_scheduling(processes, selection_key):
+    """ Menjalankan mesin non-preemptive untuk list objek Process (API lama SJF dan Priority). """
+    processes.sort(key=lambda x: x.arrival_time)  # Urutkan berdasarkan waktu kedatangan
+    table = ProcessTable.from_processes(processes)
+    result = ScheduleResult(table)
+    gantt_chart = _non_preemptive_engine(table, result, selection_key(table))
+    result.copy_to(processes)
 
-    completed_processes.sort(key=lambda x: x.pid) # Pastikan urutan output konsisten
+    completed_processes = sorted(processes, key=lambda x: (x.pid, x.completion_time))  # Pastikan urutan output konsisten
     return completed_processes, gantt_chart
 
 
-# --- Round Robin Scheduling (Preemptive) ---
-def round_robin_scheduling(processes, time_quantum):
+# --- SJF Scheduling (Non-Preemptive) ---
+def sjf_scheduling(processes):
     """
-    Fungsi Round Robin Scheduling: Implementasi dengan time quantum (Preemptive).
-    Prinsip: Setiap proses mendapat jatah eksekusi (time_quantum) secara bergantian.
+    Implementasi algoritma Shortest Job First (SJF) Non-Preemptive.
+    Prinsip: Di antara proses yang sudah tiba (available), pilih yang waktu burst-nya terpendek.
     """
+    # Kunci Utama SJF: Proses dengan waktu burst terpendek keluar lebih dulu dari heap
+    return _non_preemptive_scheduling(processes, lambda table: table.burst_time)
 
-    n = len(processes)
-    # Gunakan copy() karena ini algoritma preemptive, butuh modifikasi remaining time
-    processes_copy = [p.copy() for p in processes]
 
-    # Inisialisasi awal untuk RR
-    for p in processes_copy:
-        p.remaining_burst_time = p.burst_time
-        p.last_execution_end_time = p.arrival_time # Kapan terakhir kali keluar dari CPU/tiba
-        p.has_started = False
-
-    processes_copy.sort(key=lambda x: x.arrival_time) # Urutkan berdasarkan waktu kedatangan
-    current_time = 0
-    completed_processes = []
-    gantt_chart = []
-    ready_queue = []  # Antrian siap
-    process_arrival_index = 0 # Indeks untuk melacak proses yang belum tiba
-
-    
+# --- Mesin Round Robin (Kolumnar) ---
+def _round_robin_engine(table, result, time_quantum, stats=None, checkpoints=None, resume=None):
+    """
+    Menjalankan Round Robin di atas ProcessTable, menulis ke kolom `result`, dan mengembalikan Gantt chart.
+    `checkpoints` dan `resume` seperti pada _non_preemptive_engine; state per proses di checkpoint adalah
+    (sisa burst, akhir eksekusi terakhir, sudah mulai, start time, waiting time sejauh ini).
+    """
+    pid, arrival, burst = table.pid, table.arrival_time, table.burst_time
+    start, completion = result.start_time, result.completion_time
+    turnaround, waiting = result.turnaround_time, result.waiting_time
+    order = table.arrival_order()
+    n = len(order)
+
+    # State khusus RR per posisi kedatangan (bukan salinan objek Process), diisi saat proses tiba
+    remaining_burst_time = [0] * n  # Sisa burst setiap proses
+    last_execution_end_time = [0] * n  # Kapan terakhir kali keluar dari CPU/tiba
+    has_started = bytearray(n)  # Flag apakah proses sudah mulai dieksekusi
+
+    if resume is None:
+        current_time = 0
+        completed = 0
+        gantt_chart = GanttChart()  # Quantum berturut-turut milik proses yang sama digabung menjadi satu segmen
+        ready_queue = deque()  # Antrian siap berisi posisi proses: append/popleft O(1)
+        process_arrival_index = 0 # Indeks untuk melacak proses yang belum tiba
+    else:
+        checkpoint, gantt_chart = resume
+        current_time, completed = checkpoint.time, checkpoint.completed
+        process_arrival_index = checkpoint.next_arrival
+        ready_queue = deque(checkpoint.ready)
+        for position, state in checkpoint.in_flight.items():
+            row = order[position]
+            remaining_burst_time[position], last_execution_end_time[position], has_started[position], \
+                start[row], waiting[row] = state
+    log = None if checkpoints is None else _CheckpointLog(checkpoints, resume)
+    events = 0
+
+    def admit(position):
+        """ Proses tiba: inisialisasi state RR-nya lalu masukkan ke ready queue. """
+        row = order[position]
+        remaining_burst_time[position] = burst[row]
+        last_execution_end_time[position] = arrival[row]
+        ready_queue.append(position)
+
+    while completed < n:
+        if log is not None:
+            if events >= log.next_event:
+                in_flight = {position: (remaining_burst_time[position], last_execution_end_time[position],
+                                        has_started[position], start[order[position]], waiting[order[position]])
+                             for position in ready_queue}
+                log.add(events, EngineCheckpoint(current_time, process_arrival_index, completed, gantt_chart,
+                                                 ready_queue, in_flight))
+            events += 1
 
-    while len(completed_processes) < n:
         # 1. Tambahkan Proses Tiba: Masukkan proses baru yang sudah tiba ke ready queue
-        while process_arrival_index < n and processes_copy[process_arrival_index].arrival_time <= current_time:
-            p = processes_copy[process_arrival_index]
-            if p.remaining_burst_time > 0 and p not in ready_queue:
-                ready_queue.append(p)
+        while process_arrival_index < n and arrival[order[process_arrival_index]] <= current_time:
+            admit(process_arrival_index)
             process_arrival_index += 1
 
-        if not ready_queue:  # CPU idle
-            current_time += 1
+        if not ready_queue:  # CPU idle: lompat langsung ke waktu kedatangan proses berikutnya
+            next_arrival_time = arrival[order[process_arrival_index]]
+            _record_idle(gantt_chart, current_time, next_arrival_time)
+            if stats is not None:
+                stats.record_idle(current_time, next_arrival_time)
+            current_time = next_arrival_time
             continue
 
-        current_process = ready_queue.pop(0) # 2. Ambil Proses Pertama dari Queue (FIFO)
+        if stats is not None:
+            stats.dispatches += 1
+            stats.observe_ready_queue(len(ready_queue))
+        current = ready_queue.popleft() # 2. Ambil Proses Pertama dari Queue (FIFO)
+        row = order[current]
 
         # Set start_time hanya pada eksekusi pertama
-        if not current_process.has_started:
-            current_process.start_time = current_time
-            current_process.has_started = True
-
-        # 3. Hitung Waktu Eksekusi: Maksimal time_quantum atau sisa burst time
-        execute_time = min(time_quantum, current_process.remaining_burst_time)
+        if not has_started[current]:
+            start[row] = current_time
+            has_started[current] = True
+
+        # 3. Hitung Waktu Eksekusi: Maksimal time_quantum atau sisa burst time.
+        # Quantum batching: jika hanya proses ini yang runnable, jalankan beberapa quantum sekaligus
+        # sampai proses tiba berikutnya atau sampai selesai (hasilnya sama dengan quantum satu per satu).
+        quanta = 1
+        if not ready_queue:
+            quanta = max(1, -(-remaining_burst_time[current] // time_quantum))
+            if process_arrival_index < n:
+                time_to_arrival = arrival[order[process_arrival_index]] - current_time
+                quanta = min(quanta, -(-time_to_arrival // time_quantum))
+        execute_time = min(quanta * time_quantum, remaining_burst_time[current])
+        if stats is not None:
+            stats.quanta += quanta
 
         # 4. Hitung Waktu Tunggu: Waktu tunggu = Waktu saat ini - Waktu terakhir selesai eksekusi/tiba
-        if current_process.last_execution_end_time != -1:
-            current_process.waiting_time += (current_time - current_process.last_execution_end_time)
+        if last_execution_end_time[current] != -1:
+            waiting[row] += (current_time - last_execution_end_time[current])
 
-        # Rekam segmen ini di Gantt chart
-        gantt_chart.append((current_process.pid, current_time, current_time + execute_time))
+        # Rekam segmen di Gantt chart (digabung dengan segmen sebelumnya jika proses yang sama berlanjut)
+        end_time = current_time + execute_time
+        gantt_chart.add(pid[row], current_time, end_time)
 
         # 5. Update Waktu dan Sisa Burst
-        current_process.remaining_burst_time -= execute_time
-        current_time += execute_time
-        current_process.last_execution_end_time = current_time # Update waktu akhir eksekusi
+        remaining_burst_time[current] -= execute_time
+        current_time = end_time
+        last_execution_end_time[current] = current_time # Update waktu akhir eksekusi
 
         # 6. Tambahkan Proses Baru yang Tiba Saat Eksekusi Berlangsung
-        while process_arrival_index < n and processes_copy[process_arrival_index].arrival_time <= current_time:
-            p = processes_copy[process_arrival_index]
-            if p.remaining_burst_time > 0 and p not in ready_queue:
-                ready_queue.append(p)
+        while process_arrival_index < n and arrival[order[process_arrival_index]] <= current_time:
+            admit(process_arrival_index)
             process_arrival_index += 1
 
-        if current_process.remaining_burst_time > 0: 
+        if remaining_burst_time[current] > 0:
             # 7. Belum Selesai: Masukkan kembali ke ANTRIAN BELAKANG
-            ready_queue.append(current_process)
-        else: 
-            # 8. Selesai: Hitung metrik akhir dan pindahkan ke completed
-            current_process.completion_time = current_time
-            current_process.turnaround_time = current_process.completion_time - current_process.arrival_time
-            completed_processes.append(current_process)
-
-    completed_processes.sort(key=lambda x: x.pid)
+            ready_queue.append(current)
+        else:
+            # 8. Selesai: Hitung metrik akhir
+            completion[row] = current_time
+            turnaround[row] = completion[row] - arrival[row]
+            completed += 1
+
+    return gantt_chart
+
+
+# --- Round Robin Scheduling (Preemptive) ---
+def round_robin_scheduling(processes, time_quantum):
+    """
+    Fungsi Round Robin Scheduling: Implementasi dengan time quantum (Preemptive).
+    Prinsip: Setiap proses mendapat jatah eksekusi (time_quantum) secara bergantian.
+    """
+    # Gunakan copy() agar objek input tidak ikut berubah (perilaku sama seperti sebelumnya)
+    processes_copy = [p.copy() for p in processes]
+    processes_copy.sort(key=lambda x: x.arrival_time) # Urutkan berdasarkan waktu kedatangan
+
+    table = ProcessTable.from_processes(processes_copy)
+    result = ScheduleResult(table)
+    gantt_chart = _round_robin_engine(table, result, time_quantum)
+    result.copy_to(processes_copy)
+
+    # State akhir RR pada objek hasil: sudah mulai, sisa burst habis, terakhir keluar CPU saat selesai
+    for p in processes_copy:
+        p.remaining_burst_time = 0
+        p.last_execution_end_time = p.completion_time
+        p.has_started = True
+
+    completed_processes = sorted(processes_copy, key=lambda x: (x.pid, x.completion_time))
     return completed_processes, gantt_chart
 
 
@@ -229,51 +833,183 @@ def priority_scheduling(processes):
     Implementasi algoritma Priority Scheduling Non-Preemptive.
     Prinsip: Di antara proses yang sudah tiba, pilih yang memiliki prioritas tertinggi (angka prioritas terendah).
     """
-    processes.sort(key=lambda x: x.arrival_time)
-    current_time = 0
-    completed_processes = []
-    gantt_chart = []
-    n = len(processes)
-    is_completed = [False] * n
-
-    while len(completed_processes) < n:
-        # 1. Identifikasi Proses yang Sudah Tersedia
-        available_processes = []
-        for i in range(n):
-            if processes[i].arrival_time <= current_time and not is_completed[i]:
-                available_processes.append(processes[i])
-
-        if not available_processes:
-            # 2. CPU Idle
-            current_time += 1
+    # Kunci Utama Priority: Proses dengan angka prioritas terkecil keluar lebih dulu dari heap
+    return _non_preemptive_scheduling(processes, lambda table: table.priority)
+
+
+# --- Mesin Event-Driven untuk Algoritma Preemptive ---
+def _preemptive_engine(table, result, selection_key, shortest_remaining=False, aging_interval=None, stats=None,
+                       checkpoints=None, resume=None):
+    """
+    Mesin bersama SRTF dan Priority Scheduling Preemptive di atas ProcessTable. Keputusan hanya
+    dievaluasi ulang pada event kedatangan, penyelesaian proses, dan (dengan aging) saat prioritas efektif
+    kandidat teratas menyalip proses yang berjalan; di antara dua event waktu simulasi melompat langsung
+    ke event berikutnya (tidak disimulasikan per satuan waktu).
+    Ready queue adalah min-heap (kunci, posisi kedatangan) dengan kunci yang tetap selama proses menunggu:
+    - SRTF (shortest_remaining=True): sisa burst time. Sisa burst hanya berubah saat proses berjalan,
+      dan proses yang berjalan tidak berada di heap.
+    - Priority: angka prioritas. Dengan aging, prioritas efektif membaik satu tingkat per `aging_interval`
+      satuan waktu menunggu. Dikali aging_interval, prioritas efektif proses yang menunggu pada waktu t:
+          priority * aging_interval - total_tunggu_sebelumnya - (t - mulai_menunggu) = kunci - t
+      dengan kunci = priority * aging_interval - total_tunggu_sebelumnya + mulai_menunggu. Suku -t sama
+      untuk semua isi heap, jadi urutan heap tidak pernah berubah: aging dihitung lazy hanya saat kandidat
+      teratas dibandingkan dengan proses yang berjalan, tanpa biaya per tick dan tanpa decrease-key.
+    Preemption hanya terjadi jika kandidat teratas lebih baik secara ketat dari proses yang berjalan.
+    `checkpoints` dan `resume` seperti pada _non_preemptive_engine; state per proses di checkpoint adalah
+    (sisa burst, total tunggu, mulai menunggu, sudah mulai, start time), ditambah proses yang sedang berjalan.
+    """
+    pid, arrival, burst = table.pid, table.arrival_time, table.burst_time
+    start, completion = result.start_time, result.completion_time
+    turnaround, waiting = result.turnaround_time, result.waiting_time
+    order = table.arrival_order()
+    n = len(order)
+    aging = aging_interval is not None and not shortest_remaining
+
+    remaining = [0] * n  # Sisa burst per posisi kedatangan (diisi saat tiba; untuk yang berjalan: saat dispatch)
+    waited = [0] * n  # Total waktu menunggu sejauh ini (dipakai aging)
+    ready_since = [0] * n  # Kapan proses terakhir kali masuk ready queue (dipakai aging)
+    has_started = bytearray(n)
+
+    if resume is None:
+        current_time = 0
+        completed = 0
+        gantt_chart = GanttChart()
+        ready_heap = []  # Min-heap berisi (kunci, posisi kedatangan)
+        next_arrival = 0  # Kursor ke proses berikutnya yang belum tiba
+        running = -1  # Posisi proses yang sedang berjalan, -1 jika CPU kosong
+        running_value = 0  # Nilai pembanding proses berjalan (SRTF: sisa burst saat dispatch)
+        dispatch_time = 0
+    else:
+        checkpoint, gantt_chart = resume
+        current_time, completed, next_arrival = checkpoint.time, checkpoint.completed, checkpoint.next_arrival
+        ready_heap = list(checkpoint.ready)
+        running, running_value, dispatch_time = checkpoint.running
+        for position, state in checkpoint.in_flight.items():
+            remaining[position], waited[position], ready_since[position], has_started[position], \
+                start[order[position]] = state
+    log = None if checkpoints is None else _CheckpointLog(checkpoints, resume)
+    events = 0
+
+    def enqueue(position, time):
+        """ Memasukkan proses ke ready queue dengan kunci heap yang tetap selama ia menunggu. """
+        if shortest_remaining:
+            key = remaining[position]
+        elif aging:
+            ready_since[position] = time
+            key = selection_key[order[position]] * aging_interval - waited[position] + time
+        else:
+            key = selection_key[order[position]]
+        heapq.heappush(ready_heap, (key, position))
+
+    while completed < n:
+        if log is not None:
+            if events >= log.next_event:
+                in_flight = {position: (remaining[position], waited[position], ready_since[position],
+                                        has_started[position], start[order[position]])
+                             for position in [entry[1] for entry in ready_heap] + [running] if position != -1}
+                log.add(events, EngineCheckpoint(current_time, next_arrival, completed, gantt_chart, ready_heap,
+                                                 in_flight, (running, running_value, dispatch_time)))
+            events += 1
+
+        # 1. Event kedatangan: masukkan semua proses yang sudah tiba ke heap
+        while next_arrival < n and arrival[order[next_arrival]] <= current_time:
+            remaining[next_arrival] = burst[order[next_arrival]]
+            enqueue(next_arrival, current_time)
+            next_arrival += 1
+
+        # 2. Evaluasi ulang: preempt proses berjalan jika kandidat teratas lebih baik
+        if running != -1 and ready_heap:
+            candidate = ready_heap[0][0] - current_time if aging else ready_heap[0][0]
+            current = running_value - (current_time - dispatch_time) if shortest_remaining else running_value
+            if candidate < current:
+                gantt_chart.add(pid[order[running]], dispatch_time, current_time)
+                remaining[running] -= current_time - dispatch_time
+                enqueue(running, current_time)
+                running = -1
+                if stats is not None:
+                    stats.preemptions += 1
+
+        if running == -1:
+            if not ready_heap:
+                # CPU Idle: lompat langsung ke waktu kedatangan proses berikutnya
+                next_arrival_time = arrival[order[next_arrival]]
+                _record_idle(gantt_chart, current_time, next_arrival_time)
+                if stats is not None:
+                    stats.record_idle(current_time, next_arrival_time)
+                current_time = next_arrival_time
+                continue
+
+            # 3. Dispatch: proses dengan kunci terkecil (prioritas efektif terbaik) ke CPU
+            if stats is not None:
+                stats.dispatches += 1
+                stats.observe_ready_queue(len(ready_heap))
+            _, running = heapq.heappop(ready_heap)
+            row = order[running]
+            if not has_started[running]:
+                start[row] = current_time  # Start time hanya pada eksekusi pertama
+                has_started[running] = True
+            if aging:
+                waited[running] += current_time - ready_since[running]
+                running_value = selection_key[row] * aging_interval - waited[running]  # Tidak menua selama berjalan
+            elif shortest_remaining:
+                running_value = remaining[running]
+            else:
+                running_value = selection_key[row]
+            dispatch_time = current_time
+
+        # 4. Lompat ke event berikutnya: kedatangan atau aging crossing sebelum proses selesai, atau penyelesaian
+        #    proses. Dengan aging, kandidat teratas (kunci - t) menyalip proses berjalan pada tick pertama
+        #    t > kunci - running_value; kunci heap tetap, jadi waktu itu dihitung O(1) dari puncak heap.
+        finish_time = dispatch_time + remaining[running]
+        next_event = arrival[order[next_arrival]] if next_arrival < n else finish_time
+        if aging and ready_heap:
+            next_event = min(next_event, ready_heap[0][0] - running_value + 1)
+        if next_event < finish_time:
+            current_time = next_event
             continue
 
-        # 3. Kunci Utama Priority: Pilih proses dengan prioritas tertinggi (angka terkecil)
-        available_processes.sort(key=lambda x: x.priority)
-        highest_priority_job = available_processes[0]
+        row = order[running]
+        gantt_chart.add(pid[row], dispatch_time, finish_time)
+        current_time = finish_time
+        remaining[running] = 0
+        completion[row] = current_time
+        turnaround[row] = completion[row] - arrival[row]
+        waiting[row] = turnaround[row] - burst[row]  # Total waktu di ready queue (termasuk setelah preemption)
+        running = -1
+        completed += 1
 
-        # Temukan indeks proses yang dipilih di daftar proses asli
-        highest_priority_job_index = -1
-        for i in range(n):
-            if processes[i].pid == highest_priority_job.pid and not is_completed[i]:
-                highest_priority_job_index = i
-                break
+    return gantt_chart
 
-        process = processes[highest_priority_job_index]
 
-        # 4. Eksekusi Proses: Non-preemptive, berjalan sampai selesai
-        process.start_time = current_time
-        process.completion_time = process.start_time + process.burst_time
-        process.turnaround_time = process.completion_time - process.arrival_time
-        process.waiting_time = process.turnaround_time - process.burst_time
+def _preemptive_scheduling(processes, selection_key, shortest_remaining=False, aging_interval=None):
+    """ Menjalankan mesin preemptive untuk list objek Process (API SRTF dan Priority Preemptive). """
+    processes.sort(key=lambda x: x.arrival_time)  # Urutkan berdasarkan waktu kedatangan
+    table = ProcessTable.from_processes(processes)
+    result = ScheduleResult(table)
+    gantt_chart = _preemptive_engine(table, result, selection_key(table), shortest_remaining, aging_interval)
+    result.copy_to(processes)
+    return sorted(processes, key=lambda x: (x.pid, x.completion_time)), gantt_chart
 
-        gantt_chart.append((process.pid, current_time, process.completion_time))
-        current_time = process.completion_time
-        is_completed[highest_priority_job_index] = True
-        completed_processes.append(process)
 
-    completed_processes.sort(key=lambda x: x.pid)
-    return completed_processes, gantt_chart
+# --- SRTF Scheduling (Shortest Remaining Time First, Preemptive) ---
+def srtf_scheduling(processes):
+    """
+    Implementasi algoritma Shortest Remaining Time First (SJF Preemptive).
+    Prinsip: Proses yang baru tiba merebut CPU jika burst-nya lebih pendek dari sisa burst proses yang berjalan.
+    """
+    return _preemptive_scheduling(processes, lambda table: table.burst_time, shortest_remaining=True)
+
+
+# --- Priority Scheduling (Preemptive) ---
+def preemptive_priority_scheduling(processes, aging_interval=None):
+    """
+    Implementasi algoritma Priority Scheduling Preemptive.
+    Prinsip: Proses dengan prioritas lebih tinggi (angka lebih kecil) yang tiba merebut CPU.
+    `aging_interval` opsional: prioritas proses yang menunggu membaik satu tingkat setiap aging_interval
+    satuan waktu, mencegah starvation proses berprioritas rendah.
+    """
+    return _preemptive_scheduling(processes, lambda table: table.priority, aging_interval=aging_interval)
+
 
 # --- Fungsi Utility (Setup dan Main Execution) ---
 
@@ -287,37 +1023,270 @@ def get_default_processes():
     ]
     return [Process(p[0], p[1], p[2], p[3]) for p in process_data]
 
-def run_all_schedulers(processes):
-    """ Menjalankan semua algoritma penjadwalan dan mengembalikan hasilnya dalam bentuk dictionary. """
-    results = {}
+# Urutan algoritma pada hasil run_all_schedulers (juga urutan kartu di halaman web)
+ALGORITHMS = ('FCFS', 'SJF', 'Round Robin', 'Priority Scheduling', 'SRTF', 'Preemptive Priority')
 
-    # FCFS: Menggunakan salinan proses
-    processes_fcfs = [p.copy() for p in processes]
-    scheduled_fcfs, gantt_fcfs = fcfs_scheduling(processes_fcfs)
-    avg_waiting_fcfs = calculate_average_waiting_time(scheduled_fcfs)
-    results['FCFS'] = {'processes': scheduled_fcfs, 'gantt_chart': gantt_fcfs, 'avg_waiting_time': avg_waiting_fcfs}
-
-    # SJF: Menggunakan salinan proses
-    processes_sjf = [p.copy() for p in processes]
-    scheduled_sjf, gantt_sjf = sjf_scheduling(processes_sjf)
-    avg_waiting_sjf = calculate_average_waiting_time(scheduled_sjf)
-    results['SJF'] = {'processes': scheduled_sjf, 'gantt_chart': gantt_sjf, 'avg_waiting_time': avg_waiting_sjf}
-
-    # Round Robin: Menggunakan salinan proses dan Time Quantum = 2
-    time_quantum = 2
-    processes_rr = [p.copy() for p in processes]
-    scheduled_rr, gantt_rr = round_robin_scheduling(processes_rr, time_quantum)
-    avg_waiting_rr = calculate_average_waiting_time(scheduled_rr)
-    results['Round Robin'] = {'processes': scheduled_rr, 'gantt_chart': gantt_rr, 'avg_waiting_time': avg_waiting_rr, 'time_quantum': time_quantum}
-
-    # Priority: Menggunakan salinan proses
-    processes_priority = [p.copy() for p in processes]
-    scheduled_priority, gantt_priority = priority_scheduling(processes_priority)
-    avg_waiting_priority = calculate_average_waiting_time(scheduled_priority)
-    results['Priority Scheduling'] = {'processes': scheduled_priority, 'gantt_chart': gantt_priority, 'avg_waiting_time': avg_waiting_priority}
+def _run_engine(table, algorithm, time_quantum, stats=None, aging_interval=None, checkpoints=None, resume=None,
+                result=None):
+    """
+    Menjalankan satu algoritma (berdasarkan nama) di atas tabel, mengembalikan (ScheduleResult, Gantt chart).
+    `checkpoints`, `resume`, dan `result` (kolom hasil yang awalannya sudah terisi) dipakai incremental.py.
+    """
+    result = ScheduleResult(table) if result is None else result
+    state = {'stats': stats, 'checkpoints': checkpoints, 'resume': resume}
+    if algorithm == 'FCFS':
+        gantt_chart = _fcfs_engine(table, result, **state)
+    elif algorithm == 'SJF':
+        gantt_chart = _non_preemptive_engine(table, result, table.burst_time, **state)  # Kunci seleksi kolom burst_time
+    elif algorithm == 'Round Robin':
+        gantt_chart = _round_robin_engine(table, result, time_quantum, **state)
+    elif algorithm == 'Priority Scheduling':
+        gantt_chart = _non_preemptive_engine(table, result, table.priority, **state)  # Kunci seleksi kolom priority
+    elif algorithm == 'SRTF':
+        gantt_chart = _preemptive_engine(table, result, table.burst_time, shortest_remaining=True, **state)
+    elif algorithm == 'Preemptive Priority':
+        gantt_chart = _preemptive_engine(table, result, table.priority, aging_interval=aging_interval, **state)
+    else:
+        raise ValueError(f"Algoritma tidak dikenal: {algorithm}")
+    return result, gantt_chart
+
+def _run_instrumented(table, algorithm, time_quantum, instrument, aging_interval=None):
+    """
+    Seperti _run_engine, tetapi dengan instrumentasi: `instrument` True (counter + timing fase)
+    atau nama profiler dari PROFILERS ('cprofile'/'tracemalloc') untuk sekaligus memprofil run ini.
+    Mengembalikan (ScheduleResult, Gantt chart, EngineStats).
+    """
+    stats = EngineStats(algorithm)
+    with profiled(stats, instrument if instrument in PROFILERS else None):
+        with stats.phase('arrival_order'):
+            table.arrival_order()  # Di-cache per tabel: hanya run pertama yang membayar sort
+        with stats.phase('engine'):
+            result, gantt_chart = _run_engine(table, algorithm, time_quantum, stats, aging_interval)
+    stats.context_switches = count_context_switches(gantt_chart)
+    return result, gantt_chart, stats
+
+def _build_result_entry(algorithm, result, gantt_chart, time_quantum, stats=None):
+    """
+    Menyusun entri dictionary hasil satu algoritma dalam bentuk yang dipakai template Flask.
+    Jika run diinstrumentasi, entri mendapat kunci 'instrumentation' dan stats dicatat di registry /metrics.
+    """
+    # FCFS ditampilkan sesuai urutan kedatangan, algoritma lain terurut berdasarkan PID
+    order = result.table.arrival_order() if algorithm == 'FCFS' else None
+    if stats is None:
+        metrics = calculate_metrics(result)
+    else:
+        with stats.phase('metrics'):
+            metrics = calculate_metrics(result)
+    entry = {'processes': result.processes(order), 'gantt_chart': gantt_chart,
+             'avg_waiting_time': metrics['avg_waiting_time'], 'metrics': metrics}
+    if algorithm == 'Round Robin':
+        entry['time_quantum'] = time_quantum
+    if stats is not None:
+        entry['instrumentation'] = stats.to_dict()
+        registry.record(stats)
+    return entry
+
+
+def run_scheduler(processes, algorithm, time_quantum=DEFAULT_TIME_QUANTUM, instrument=None, aging_interval=None):
+    """ Menjalankan satu algoritma (nama dari ALGORITHMS) dan mengembalikan entri hasil seperti di run_all_schedulers. """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    if not instrument:
+        result, gantt_chart = _run_engine(table, algorithm, time_quantum, aging_interval=aging_interval)
+        return _build_result_entry(algorithm, result, gantt_chart, time_quantum)
+    result, gantt_chart, stats = _run_instrumented(table, algorithm, time_quantum, instrument, aging_interval)
+    return _build_result_entry(algorithm, result, gantt_chart, time_quantum, stats)
+
+
+# --- Eksekusi Paralel (Process Pool) ---
+_worker_table = None  # Tabel proses milik worker, dikirim sekali saat worker dibuat
+
+def _init_worker(table):
+    """ Initializer worker: menerima ProcessTable (di-pickle sekali per worker, bukan per tugas). """
+    global _worker_table
+    _worker_table = table
+
+def _run_engine_in_worker(algorithm, time_quantum, instrument=None, aging_interval=None):
+    """ Tugas worker: jalankan satu algoritma dan kirim balik kolom hasil ringkas + Gantt chart (+ EngineStats). """
+    if not instrument:
+        result, gantt_chart = _run_engine(_worker_table, algorithm, time_quantum, aging_interval=aging_interval)
+        return result.columns(), gantt_chart, None
+    result, gantt_chart, stats = _run_instrumented(_worker_table, algorithm, time_quantum, instrument, aging_interval)
+    return result.columns(), gantt_chart, stats
+
+
+def _check_time_quantum(time_quantum):
+    """ Time quantum harus positif: quantum <= 0 membuat Round Robin membagi dengan nol atau tidak pernah maju. """
+    if time_quantum <= 0:
+        raise ValueError(f"Time quantum harus bilangan bulat positif: {time_quantum}")
+
+
+def run_all_schedulers(processes, workers=None, time_quantum=DEFAULT_TIME_QUANTUM, instrument=None, aging_interval=None):
+    """
+    Menjalankan semua algoritma penjadwalan dan mengembalikan hasilnya dalam bentuk dictionary.
+    `processes` boleh berupa list objek Process atau ProcessTable. Input dikemas sekali ke tabel
+    kolumnar dan setiap algoritma menulis ke kolom hasilnya sendiri (tanpa menyalin objek proses).
+    `workers` > 1 menjalankan setiap algoritma di process terpisah (ProcessPoolExecutor); hasilnya
+    digabung kembali ke bentuk dictionary yang sama.
+    `instrument` (True, 'cprofile', atau 'tracemalloc') menambahkan kunci 'instrumentation' di setiap
+    entri: timing fase, jumlah dispatch, kedalaman ready queue maksimum, dan lompatan idle.
+    `aging_interval` mengaktifkan aging pada Preemptive Priority (lihat _preemptive_engine).
+    Melempar ValueError jika time_quantum <= 0.
+    """
+    _check_time_quantum(time_quantum)
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    results = {}
 
+    if not workers or workers <= 1:
+        for algorithm in ALGORITHMS:
+            if instrument:
+                result, gantt_chart, stats = _run_instrumented(table, algorithm, time_quantum, instrument, aging_interval)
+            else:
+                (result, gantt_chart), stats = _run_engine(table, algorithm, time_quantum, aging_interval=aging_interval), None
+            results[algorithm] = _build_result_entry(algorithm, result, gantt_chart, time_quantum, stats)
+        return results
+
+    table.arrival_order()  # Hitung urutan kedatangan sekali sebelum tabel dikirim ke worker
+    with ProcessPoolExecutor(max_workers=min(workers, len(ALGORITHMS)),
+                             initializer=_init_worker, initargs=(table,)) as executor:
+        futures = {algorithm: executor.submit(_run_engine_in_worker, algorithm, time_quantum, instrument, aging_interval)
+                   for algorithm in ALGORITHMS}
+        for algorithm, future in futures.items():
+            columns, gantt_chart, stats = future.result()
+            result = ScheduleResult(table, columns)
+            results[algorithm] = _build_result_entry(algorithm, result, gantt_chart, time_quantum, stats)
     return results
 
+
+# --- Parameter Sweep (Time Quantum dan Variasi Algoritma) ---
+# Satu baris tabel hasil sweep, ringkas dan siap di-plot (misal avg_waiting_time vs time_quantum)
+SweepRow = namedtuple('SweepRow', [
+    'algorithm', 'time_quantum', 'avg_waiting_time', 'p95_waiting_time', 'avg_turnaround_time',
+    'context_switches', 'makespan', 'throughput', 'cpu_utilization',
+])
+
+def _sweep_run(table, algorithm, time_quantum):
+    """ Menjalankan satu titik sweep dan meringkasnya menjadi SweepRow (Gantt chart tidak disimpan). """
+    result, gantt_chart = _run_engine(table, algorithm, time_quantum)
+    metrics = calculate_metrics(result)
+    return SweepRow(algorithm, time_quantum, metrics['avg_waiting_time'], metrics['p95_waiting_time'],
+                    metrics['avg_turnaround_time'], count_context_switches(gantt_chart),
+                    metrics['makespan'], metrics['throughput'], metrics['cpu_utilization'])
+
+def _sweep_run_in_worker(algorithm, time_quantum):
+    """ Tugas worker sweep: memakai tabel yang sudah dikirim sekali lewat _init_worker. """
+    return _sweep_run(_worker_table, algorithm, time_quantum)
+
+def sweep(processes, algorithms=ALGORITHMS, quanta=(DEFAULT_TIME_QUANTUM,), workers=None):
+    """
+    Parameter sweep: menjalankan setiap algoritma pada trace yang sama, dan Round Robin untuk
+    setiap time quantum di `quanta`. Algoritma lain tidak bergantung pada quantum sehingga cukup
+    dijalankan sekali (time_quantum=None). Trace dikemas dan diurutkan sekali lalu dipakai ulang
+    oleh semua run; dengan `workers` > 1 run disebar ke process pool.
+    Generator: setiap SweepRow di-yield begitu run-nya selesai (urutan bisa berbeda saat paralel).
+    Melempar ValueError untuk algoritma yang tidak dikenal atau quantum <= 0 (sebelum run pertama).
+    """
+    table = processes if isinstance(processes, ProcessTable) else ProcessTable.from_processes(processes)
+    table.arrival_order()  # Urutkan trace sekali untuk semua run
+
+    tasks = []
+    for algorithm in algorithms:
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Algoritma tidak dikenal: {algorithm}")
+        if algorithm == 'Round Robin':
+            for time_quantum in quanta:
+                _check_time_quantum(time_quantum)
+                tasks.append((algorithm, time_quantum))
+        else:
+            tasks.append((algorithm, None))
+
+    if not workers or workers <= 1:
+        for algorithm, time_quantum in tasks:
+            yield _sweep_run(table, algorithm, time_quantum)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(table,)) as executor:
+        futures = [executor.submit(_sweep_run_in_worker, algorithm, time_quantum) for algorithm, time_quantum in tasks]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+# Nama singkat algoritma untuk opsi CLI
+ALGORITHM_ALIASES = {'fcfs': 'FCFS', 'sjf': 'SJF', 'rr': 'Round Robin', 'priority': 'Priority Scheduling',
+                     'srtf': 'SRTF', 'ppriority': 'Preemptive Priority'}
+
+def _parse_quanta(text):
+    """
+    Parsing daftar quantum CLI: '1:50' (range, inklusif), '1:50:5' (dengan step), atau '1,2,4,8'.
+    Quantum <= 0 dan range kosong (misal '5:1') ditolak sebagai error argparse.
+    """
+    if ':' in text:
+        parts = [int(part) for part in text.split(':')]
+        start, stop = parts[0], parts[1]
+        step = parts[2] if len(parts) > 2 else 1
+        if step <= 0:
+            raise argparse.ArgumentTypeError(f"Step quantum harus positif: {text}")
+        quanta = range(start, stop + 1, step)
+    else:
+        quanta = [int(part) for part in text.split(',')]
+    if not quanta:
+        raise argparse.ArgumentTypeError(f"Rentang quantum kosong: {text}")
+    if min(quanta) <= 0:
+        raise argparse.ArgumentTypeError(f"Time quantum harus bilangan bulat positif: {text}")
+    return quanta
+
+def sweep_main(argv=None):
+    """ CLI sweep: mencetak tabel hasil (CSV) ke stdout, satu baris per run segera setelah run selesai. """
+    parser = argparse.ArgumentParser(prog='scheduler.py sweep', description='Parameter sweep time quantum dan algoritma penjadwalan.')
+    parser.add_argument('trace', nargs='?', help='File trace CSV (pid,arrival_time,burst_time,priority) atau biner; default: data proses contoh')
+    parser.add_argument('--quanta', type=_parse_quanta, default=range(1, 11), help="Daftar quantum, misal '1:50', '1:100:5' atau '1,2,4,8'")
+    parser.add_argument('--algorithms', default='rr', help="Daftar algoritma dipisah koma: fcfs,sjf,rr,priority,srtf,ppriority")
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah worker process (default: sekuensial)')
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        from trace_loader import load_trace  # Import lokal: trace_loader sendiri mengimpor scheduler
+        table = load_trace(args.trace)
+    else:
+        table = ProcessTable.from_processes(get_default_processes())
+    algorithms = [ALGORITHM_ALIASES[name.strip().lower()] for name in args.algorithms.split(',')]
+
+    writer = csv.writer(sys.stdout)
+    writer.writerow(SweepRow._fields)
+    for row in sweep(table, algorithms, quanta=args.quanta, workers=args.workers):
+        writer.writerow(row)
+        sys.stdout.flush()  # Streaming: baris langsung terlihat selama sweep berjalan
+
+def instrument_main(argv=None):
+    """ CLI instrumentasi: menjalankan semua algoritma dengan counter + timing fase dan mencetak ringkasannya. """
+    parser = argparse.ArgumentParser(prog='scheduler.py instrument', description='Instrumentasi dan profiling mesin penjadwalan.')
+    parser.add_argument('trace', nargs='?', help='File trace CSV atau biner; default: data proses contoh')
+    parser.add_argument('--time-quantum', type=int, default=DEFAULT_TIME_QUANTUM, help='Time quantum Round Robin')
+    parser.add_argument('--profile', choices=PROFILERS, help='Nyalakan cProfile atau tracemalloc untuk setiap algoritma')
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        from trace_loader import load_trace  # Import lokal: trace_loader sendiri mengimpor scheduler
+        table = load_trace(args.trace)
+    else:
+        table = ProcessTable.from_processes(get_default_processes())
+    results = run_all_schedulers(table, time_quantum=args.time_quantum, instrument=args.profile or True)
+
+    print(f"{'Algorithm':<22}{'Engine (s)':>12}{'Metrics (s)':>13}{'Dispatches':>12}{'Quanta':>10}{'Preempt':>9}"
+          f"{'Max Ready':>11}{'Idle Jumps':>12}{'Idle Skipped':>14}{'Switches':>10}")
+    for algorithm, entry in results.items():
+        stats = entry['instrumentation']
+        print(f"{algorithm:<22}{stats['phases']['engine']:>12.4f}{stats['phases']['metrics']:>13.4f}"
+              f"{stats['dispatches']:>12}{stats['quanta']:>10}{stats['preemptions']:>9}{stats['max_ready_queue']:>11}"
+              f"{stats['idle_jumps']:>12}{stats['idle_time_skipped']:>14}{stats['context_switches']:>10}")
+    for algorithm, entry in results.items():
+        stats = entry['instrumentation']
+        if stats['peak_memory_bytes'] is not None:
+            print(f"Peak memory {algorithm}: {stats['peak_memory_bytes']} bytes")
+        if stats['profile']:
+            print(f"\ncProfile {algorithm} (waktu kumulatif teratas):")
+            for row in stats['profile']:
+                print(f"  {row['cumulative_time']:>10.4f}s {row['calls']:>9}x  {row['function']}")
+
 def cli_main():
     """ Fungsi utama untuk menjalankan simulasi dan menampilkan hasil di Command Line Interface (CLI). """
     
@@ -363,7 +1332,7 @@ def cli_main():
     print("\n========================================")
     print("Round Robin Scheduling (Time-Sliced Preemptive)")
     print("========================================")
-    time_quantum = 2
+    time_quantum = DEFAULT_TIME_QUANTUM
     processes_rr = [Process(p[0], p[1], p[2], p[3]) for p in process_data]
     scheduled_processes_rr, gantt_chart_rr = round_robin_scheduling(processes_rr, time_quantum)
 
@@ -391,4 +1360,14 @@ def cli_main():
     print(f"\nAverage Waiting Time (Priority): {avg_waiting_time_priority:.2f}")
 
 if __name__ == "__main__":
-    cli_main()
\ No newline at end of file
+    # Dijalankan lewat modul `scheduler` (bukan `__main__`) agar ProcessTable hasil trace_loader
+    # adalah kelas yang sama dengan yang dipakai fungsi-fungsi di bawah.
+    import scheduler
+    # `python scheduler.py sweep ...` menjalankan parameter sweep, `instrument ...` menampilkan
+    # instrumentasi/profiling, tanpa argumen menjalankan demo CLI
+    if len(sys.argv) > 1 and sys.argv[1] == 'sweep':
+        scheduler.sweep_main(sys.argv[2:])
+    elif len(sys.argv) > 1 and sys.argv[1] == 'instrument':
+        scheduler.instrument_main(sys.argv[2:])
+    else:
+        scheduler.cli_main()
\ No newline at end of file
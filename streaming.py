@@ -0,0 +1,267 @@
+# File streaming.py: Mode penjadwalan streaming/online untuk trace yang sangat besar
+# Setiap algoritma berupa generator yang membaca iterator kedatangan (terurut berdasarkan arrival_time)
+# dan meng-yield segmen Gantt chart serta catatan penyelesaian proses secara bertahap.
+# Memori hanya sebesar ready queue, bukan sebesar seluruh trace.
+
+import heapq
+from collections import deque, namedtuple
+
+from scheduler import DEFAULT_TIME_QUANTUM, IDLE_PID
+
+# Event yang di-yield oleh generator streaming
+GanttSegment = namedtuple('GanttSegment', ['pid', 'start', 'end'])
+Completion = namedtuple('Completion', [
+    'pid', 'arrival_time', 'burst_time', 'priority',
+    'start_time', 'completion_time', 'turnaround_time', 'waiting_time',
+])
+
+
+class RunningMetrics:
+    """
+    Metrik agregat yang diperbarui setiap kali proses selesai, sehingga bisa dibaca kapan saja
+    selama replay berjalan (memori konstan, tidak menyimpan daftar proses).
+    """
+
+    def __init__(self):
+        self.count = 0  # Jumlah proses yang sudah selesai
+        self.total_waiting_time = 0
+        self.total_turnaround_time = 0
+        self.max_waiting_time = 0
+        self.busy_time = 0  # Total burst time proses yang sudah selesai
+        self.first_arrival = None
+        self.last_completion = None
+        self.context_switches = 0
+        self._last_pid = IDLE_PID
+
+    def record_segment(self, segment):
+        """ Mencatat segmen Gantt chart (untuk menghitung context switch). """
+        if segment.pid is IDLE_PID:
+            return
+        if self._last_pid is not IDLE_PID and segment.pid != self._last_pid:
+            self.context_switches += 1
+        self._last_pid = segment.pid
+
+    def record_completion(self, record):
+        """ Mencatat satu proses yang selesai. """
+        self.count += 1
+        self.total_waiting_time += record.waiting_time
+        self.total_turnaround_time += record.turnaround_time
+        self.max_waiting_time = max(self.max_waiting_time, record.waiting_time)
+        self.busy_time += record.burst_time
+        if self.first_arrival is None or record.arrival_time < self.first_arrival:
+            self.first_arrival = record.arrival_time
+        if self.last_completion is None or record.completion_time > self.last_completion:
+            self.last_completion = record.completion_time
+
+    @property
+    def avg_waiting_time(self):
+        return self.total_waiting_time / self.count if self.count else 0.0
+
+    @property
+    def avg_turnaround_time(self):
+        return self.total_turnaround_time / self.count if self.count else 0.0
+
+    @property
+    def makespan(self):
+        return self.last_completion - self.first_arrival if self.count else 0
+
+    @property
+    def throughput(self):
+        """ Proses selesai per satuan waktu, sejauh ini. """
+        return self.count / self.makespan if self.makespan > 0 else 0.0
+
+    @property
+    def cpu_utilization(self):
+        """ Fraksi waktu CPU sibuk, sejauh ini. """
+        return self.busy_time / self.makespan if self.makespan > 0 else 0.0
+
+    def snapshot(self):
+        """ Ringkasan metrik saat ini dalam bentuk dictionary. """
+        return {
+            'count': self.count,
+            'avg_waiting_time': self.avg_waiting_time,
+            'max_waiting_time': self.max_waiting_time,
+            'avg_turnaround_time': self.avg_turnaround_time,
+            'context_switches': self.context_switches,
+            'makespan': self.makespan,
+            'throughput': self.throughput,
+            'cpu_utilization': self.cpu_utilization,
+        }
+
+
+class _ArrivalCursor:
+    """
+    Kursor peekable di atas iterator kedatangan. Elemen boleh berupa tuple
+    (pid, arrival_time, burst_time, priority) atau objek dengan atribut yang sama (misal Process).
+    Memastikan arrival_time tidak pernah mundur, karena mode streaming tidak bisa mengurutkan ulang.
+    """
+
+    def __init__(self, arrivals):
+        self._iterator = iter(arrivals)
+        self._last_arrival = None
+        self.next = None  # Proses berikutnya yang belum diambil: (pid, arrival, burst, priority) atau None
+        self._advance()
+
+    def _advance(self):
+        item = next(self._iterator, None)
+        if item is None:
+            self.next = None
+            return
+        if not isinstance(item, tuple):
+            item = (item.pid, item.arrival_time, item.burst_time, item.priority)
+        elif len(item) == 3:
+            item = item + (0,)
+        if self._last_arrival is not None and item[1] < self._last_arrival:
+            raise ValueError(f"Kedatangan harus terurut berdasarkan arrival_time (PID {item[0]} tiba di {item[1]} setelah {self._last_arrival})")
+        self._last_arrival = item[1]
+        self.next = item
+
+    def arrived_by(self, current_time):
+        """ True jika proses berikutnya sudah tiba pada current_time. """
+        return self.next is not None and self.next[1] <= current_time
+
+    def pop(self):
+        """ Mengambil proses berikutnya dan memajukan kursor. """
+        item = self.next
+        self._advance()
+        return item
+
+
+def _emit_segment(metrics, pid, start, end):
+    segment = GanttSegment(pid, start, end)
+    if metrics is not None:
+        metrics.record_segment(segment)
+    return segment
+
+def _emit_completion(metrics, pid, arrival, burst, priority, start, completion, waiting):
+    record = Completion(pid, arrival, burst, priority, start, completion, completion - arrival, waiting)
+    if metrics is not None:
+        metrics.record_completion(record)
+    return record
+
+
+# --- FCFS Streaming ---
+def stream_fcfs(arrivals, metrics=None):
+    """ FCFS online: setiap proses langsung dijalankan sesuai urutan kedatangan (memori O(1)). """
+    cursor = _ArrivalCursor(arrivals)
+    current_time = 0
+    while cursor.next is not None:
+        pid, arrival, burst, priority = cursor.pop()
+        if current_time < arrival:
+            yield _emit_segment(metrics, IDLE_PID, current_time, arrival)
+            current_time = arrival
+        completion = current_time + burst
+        yield _emit_segment(metrics, pid, current_time, completion)
+        yield _emit_completion(metrics, pid, arrival, burst, priority, current_time, completion, current_time - arrival)
+        current_time = completion
+
+
+# --- SJF dan Priority Streaming (Non-Preemptive) ---
+def _stream_non_preemptive(arrivals, key_index, metrics):
+    """
+    Mesin non-preemptive online: sama seperti _non_preemptive_engine di scheduler.py, tetapi proses
+    dibaca dari iterator hanya sampai waktu simulasi saat ini. Heap berisi (kunci, urutan kedatangan, proses).
+    """
+    cursor = _ArrivalCursor(arrivals)
+    ready_heap = []
+    sequence = 0
+    current_time = 0
+    while True:
+        while cursor.arrived_by(current_time):
+            item = cursor.pop()
+            heapq.heappush(ready_heap, (item[key_index], sequence, item))
+            sequence += 1
+
+        if not ready_heap:
+            if cursor.next is None:
+                return
+            # CPU Idle: lompat langsung ke kedatangan berikutnya
+            yield _emit_segment(metrics, IDLE_PID, current_time, cursor.next[1])
+            current_time = cursor.next[1]
+            continue
+
+        _, _, (pid, arrival, burst, priority) = heapq.heappop(ready_heap)
+        completion = current_time + burst
+        yield _emit_segment(metrics, pid, current_time, completion)
+        yield _emit_completion(metrics, pid, arrival, burst, priority, current_time, completion, current_time - arrival)
+        current_time = completion
+
+def stream_sjf(arrivals, metrics=None):
+    """ SJF Non-Preemptive online: kunci seleksi burst_time. """
+    return _stream_non_preemptive(arrivals, 2, metrics)
+
+def stream_priority(arrivals, metrics=None):
+    """ Priority Scheduling Non-Preemptive online: kunci seleksi priority. """
+    return _stream_non_preemptive(arrivals, 3, metrics)
+
+
+# --- Round Robin Streaming ---
+def stream_round_robin(arrivals, time_quantum=DEFAULT_TIME_QUANTUM, metrics=None):
+    """
+    Round Robin online dengan aturan yang sama seperti _round_robin_engine (termasuk quantum batching).
+    State tiap proses di ready queue: [pid, arrival, burst, priority, sisa burst, terakhir keluar CPU, start, waiting].
+    """
+    cursor = _ArrivalCursor(arrivals)
+    ready_queue = deque()
+    current_time = 0
+
+    def admit():
+        while cursor.arrived_by(current_time):
+            pid, arrival, burst, priority = cursor.pop()
+            ready_queue.append([pid, arrival, burst, priority, burst, arrival, None, 0])
+
+    while True:
+        admit()
+        if not ready_queue:
+            if cursor.next is None:
+                return
+            yield _emit_segment(metrics, IDLE_PID, current_time, cursor.next[1])
+            current_time = cursor.next[1]
+            continue
+
+        state = ready_queue.popleft()
+        if state[6] is None:
+            state[6] = current_time  # Start time hanya pada eksekusi pertama
+
+        quanta = 1
+        if not ready_queue:
+            quanta = max(1, -(-state[4] // time_quantum))
+            if cursor.next is not None:
+                quanta = min(quanta, -(-(cursor.next[1] - current_time) // time_quantum))
+        execute_time = min(quanta * time_quantum, state[4])
+
+        if state[5] != -1:
+            state[7] += current_time - state[5]
+
+        # Satu segmen per dispatch: quantum berturut-turut milik proses yang sama sudah digabung
+        # oleh quantum batching, sama seperti GanttChart pada mode batch
+        end_time = current_time + execute_time
+        yield _emit_segment(metrics, state[0], current_time, end_time)
+
+        state[4] -= execute_time
+        current_time = end_time
+        state[5] = current_time
+        admit()  # Proses yang tiba selama eksekusi masuk sebelum proses yang di-preempt
+
+        if state[4] > 0:
+            ready_queue.append(state)
+        else:
+            pid, arrival, burst, priority, _, _, start, waiting = state
+            yield _emit_completion(metrics, pid, arrival, burst, priority, start, current_time, waiting)
+
+
+# Nama algoritma (sama dengan scheduler.ALGORITHMS) ke generator streaming-nya
+STREAMING_ALGORITHMS = {
+    'FCFS': stream_fcfs,
+    'SJF': stream_sjf,
+    'Round Robin': stream_round_robin,
+    'Priority Scheduling': stream_priority,
+}
+
+def stream_schedule(algorithm, arrivals, time_quantum=DEFAULT_TIME_QUANTUM, metrics=None):
+    """ Menjalankan algoritma streaming berdasarkan nama; time_quantum hanya dipakai Round Robin. """
+    if algorithm not in STREAMING_ALGORITHMS:
+        raise ValueError(f"Algoritma tidak dikenal: {algorithm}")
+    if algorithm == 'Round Robin':
+        return stream_round_robin(arrivals, time_quantum, metrics)
+    return STREAMING_ALGORITHMS[algorithm](arrivals, metrics)
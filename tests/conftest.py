@@ -0,0 +1,5 @@
+# Modul proyek berada di root repositori (tanpa package): tambahkan ke sys.path agar bisa diimpor dari tests/
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,65 @@
+# Uji endpoint Flask (app.py) lewat test client
+
+import re
+
+import pytest
+
+import app
+from gantt import nice_ticks
+
+
+@pytest.fixture
+def client():
+    return app.app.test_client()
+
+
+def page_fingerprint(client):
+    html = client.get('/').get_data(as_text=True)
+    return re.search(r'var FINGERPRINT = "([0-9a-f]+)"', html).group(1)
+
+
+@pytest.mark.parametrize('time_quantum', [-1, 0])
+def test_gantt_rejects_non_positive_time_quantum(client, time_quantum):
+    response = client.post('/api/gantt', json={'algorithm': 'Round Robin', 'time_quantum': time_quantum})
+    assert response.status_code == 400
+
+
+@pytest.mark.parametrize('window', [{'t1': 'inf'}, {'t1': 'nan'}, {'t0': '-inf'}, {'t0': 'nan', 't1': 5}])
+def test_gantt_rejects_non_finite_window(client, window):
+    response = client.post('/api/gantt', json={'algorithm': 'FCFS', **window})
+    assert response.status_code == 400
+
+
+def test_nice_ticks_non_finite_span():
+    assert nice_ticks(0, float('inf'), 10) == []
+    assert nice_ticks(float('nan'), 5, 10) == []
+
+
+def test_gantt_viewport_by_fingerprint(client):
+    fingerprint = page_fingerprint(client)
+    response = client.post('/api/gantt', json={'fingerprint': fingerprint, 'algorithm': 'Round Robin',
+                                               't0': 0, 't1': 10, 'width': 500})
+    assert response.status_code == 200
+    assert response.get_json()['algorithm'] == 'Round Robin'
+    assert client.post('/api/gantt', json={'fingerprint': '0' * 64, 'algorithm': 'FCFS'}).status_code == 404
+
+
+def test_page_does_not_embed_workload(client):
+    html = client.get('/').get_data(as_text=True)
+    assert 'workload-data' not in html
+
+
+def test_metrics_reports_instrumentation_state(client, monkeypatch):
+    monkeypatch.setattr(app, 'INSTRUMENT', None)
+    assert 'scheduler_instrumentation_enabled 0' in client.get('/metrics').get_data(as_text=True)
+    monkeypatch.setattr(app, 'INSTRUMENT', True)
+    assert 'scheduler_instrumentation_enabled 1' in client.get('/metrics').get_data(as_text=True)
+
+
+@pytest.mark.parametrize('query', ['t1=inf', 't1=nan', 't0=-inf', 't0=abc'])
+def test_job_gantt_rejects_invalid_window(client, query):
+    job = client.post('/api/simulations', json={'processes': [[1, 0, 5, 2], [2, 1, 3, 1]]}).get_json()
+    assert job['status'] == 'done'
+    response = client.get(f"{job['status_url']}/gantt?algorithm=FCFS&{query}")
+    assert response.status_code == 400
+    assert client.get(f"{job['status_url']}/gantt?algorithm=FCFS&t0=0&t1=4").status_code == 200
@@ -0,0 +1,146 @@
+# Uji kesetaraan: jalur NumPy vs jalur Python murni (referensi), dan mesin kolumnar vs algoritma awal
+# (implementasi list sederhana dari versi pertama scheduler.py) pada trace acak ber-seed dengan PID unik.
+
+import random
+
+import pytest
+
+import scheduler
+from scheduler import (ProcessTable, ScheduleResult, _fcfs_engine_numpy, _fcfs_engine_python, _run_engine,
+                       calculate_metrics)
+
+SEEDS = range(20)
+
+
+def random_rows(seed, n=None):
+    """ Trace acak (pid, arrival, burst, priority) dengan PID unik dan banyak kedatangan bersamaan. """
+    rng = random.Random(seed)
+    n = n or rng.randint(1, 40)
+    return [(pid, rng.randint(0, 60), rng.randint(1, 10), rng.randint(0, 5)) for pid in range(1, n + 1)]
+
+
+# --- Algoritma awal (referensi): loop per satuan waktu dan list biasa, tanpa optimasi ---
+def baseline_non_preemptive(rows, key):
+    """ SJF/Priority versi awal: pilih proses tersedia dengan kunci terkecil (sort stabil), CPU idle maju 1 tick. """
+    pending = sorted(rows, key=lambda row: row[1])
+    time, results = 0, {}
+    while pending:
+        available = [row for row in pending if row[1] <= time]
+        if not available:
+            time += 1
+            continue
+        row = min(available, key=key)  # min() mengambil yang pertama jika kunci sama, seperti sort stabil
+        pending.remove(row)
+        pid, arrival, burst, _ = row
+        results[pid] = (time, time + burst, time + burst - arrival, time - arrival)
+        time += burst
+    return results
+
+def baseline_fcfs(rows):
+    time, results = 0, {}
+    for pid, arrival, burst, _ in sorted(rows, key=lambda row: row[1]):
+        time = max(time, arrival)
+        results[pid] = (time, time + burst, time + burst - arrival, time - arrival)
+        time += burst
+    return results
+
+def baseline_round_robin(rows, time_quantum):
+    """ Round Robin versi awal: satu quantum per iterasi, proses yang tiba selama eksekusi masuk lebih dulu. """
+    pending = sorted(rows, key=lambda row: row[1])
+    remaining = {row[0]: row[2] for row in rows}
+    last_end = {row[0]: row[1] for row in rows}
+    start, waiting, results = {}, dict.fromkeys(remaining, 0), {}
+    queue, index, time = [], 0, 0
+    while len(results) < len(rows):
+        while index < len(pending) and pending[index][1] <= time:
+            queue.append(pending[index])
+            index += 1
+        if not queue:
+            time += 1
+            continue
+        row = queue.pop(0)
+        pid = row[0]
+        start.setdefault(pid, time)
+        run = min(time_quantum, remaining[pid])
+        waiting[pid] += time - last_end[pid]
+        time += run
+        remaining[pid] -= run
+        last_end[pid] = time
+        while index < len(pending) and pending[index][1] <= time:
+            queue.append(pending[index])
+            index += 1
+        if remaining[pid]:
+            queue.append(row)
+        else:
+            results[pid] = (start[pid], time, time - row[1], waiting[pid])
+    return results
+
+
+def engine_results(rows, algorithm, time_quantum=2):
+    """ Hasil mesin kolumnar sebagai {pid: (start, completion, turnaround, waiting)}. """
+    table = ProcessTable.from_tuples(rows)
+    result, _ = _run_engine(table, algorithm, time_quantum)
+    return {table.pid[row]: tuple(getattr(result, name)[row] for name in ScheduleResult.COLUMNS)
+            for row in range(len(table))}
+
+
+@pytest.mark.skipif(scheduler.np is None, reason='NumPy tidak terpasang')
+@pytest.mark.parametrize('seed', SEEDS)
+def test_fcfs_numpy_matches_python(seed):
+    table = ProcessTable.from_tuples(random_rows(seed))
+    python_result, numpy_result = ScheduleResult(table), ScheduleResult(table)
+    python_gantt = _fcfs_engine_python(table, python_result)
+    numpy_gantt = _fcfs_engine_numpy(table, numpy_result)
+    assert numpy_result.columns() == python_result.columns()
+    assert numpy_gantt == python_gantt
+
+
+@pytest.mark.skipif(scheduler.np is None, reason='NumPy tidak terpasang')
+@pytest.mark.parametrize('seed', SEEDS)
+def test_metrics_numpy_matches_python(seed, monkeypatch):
+    table = ProcessTable.from_tuples(random_rows(seed))
+    result, _ = _run_engine(table, 'SJF', 2)
+    with_numpy = calculate_metrics(result)
+    monkeypatch.setattr(scheduler, 'np', None)
+    without_numpy = calculate_metrics(result)
+    assert with_numpy.keys() == without_numpy.keys()
+    for name, value in with_numpy.items():
+        assert without_numpy[name] == pytest.approx(value), name
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_engines_match_baseline_algorithms(seed):
+    rows = random_rows(seed)
+    assert engine_results(rows, 'FCFS') == baseline_fcfs(rows)
+    assert engine_results(rows, 'SJF') == baseline_non_preemptive(rows, key=lambda row: row[2])
+    assert engine_results(rows, 'Priority Scheduling') == baseline_non_preemptive(rows, key=lambda row: row[3])
+    for time_quantum in (1, 2, 3, 7):
+        assert engine_results(rows, 'Round Robin', time_quantum) == baseline_round_robin(rows, time_quantum)
+
+
+def engine_rows(rows, algorithm, time_quantum=2):
+    """ Hasil mesin per baris input (bukan per PID), untuk trace dengan PID kembar. """
+    table = ProcessTable.from_tuples(rows)
+    result, _ = _run_engine(table, algorithm, time_quantum)
+    return [tuple(getattr(result, name)[row] for name in ScheduleResult.COLUMNS) for row in range(len(table))]
+
+
+def test_duplicate_pids_run_the_selected_job():
+    # Form web mengizinkan PID kembar. Algoritma awal mencari ulang proses terpilih berdasarkan PID dan bisa
+    # menjalankan kembarannya (P1 burst 8, bukan P1 burst 2); mesin memakai posisi kedatangan
+    rows = [(1, 0, 8, 0), (2, 0, 4, 2), (1, 0, 2, 1)]
+    assert engine_rows(rows, 'SJF') == [(6, 14, 14, 6), (2, 6, 6, 2), (0, 2, 2, 0)]
+    assert engine_rows(rows, 'Priority Scheduling') == [(0, 8, 8, 0), (10, 14, 14, 10), (8, 10, 10, 8)]
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_duplicate_pids_match_baseline_with_unique_pids(seed):
+    # PID tidak memengaruhi jadwal: hasil per baris sama dengan algoritma awal pada PID yang dibuat unik
+    rng = random.Random(seed)
+    unique = random_rows(seed)
+    rows = [(rng.randint(1, 3),) + row[1:] for row in unique]
+    for algorithm, key in (('SJF', lambda row: row[2]), ('Priority Scheduling', lambda row: row[3])):
+        expected = baseline_non_preemptive(unique, key=key)
+        assert engine_rows(rows, algorithm) == [expected[row[0]] for row in unique]
+    assert engine_rows(rows, 'FCFS') == [baseline_fcfs(unique)[row[0]] for row in unique]
+    assert engine_rows(rows, 'Round Robin') == [baseline_round_robin(unique, 2)[row[0]] for row in unique]
@@ -0,0 +1,73 @@
+# Uji simulasi ulang inkremental: memori checkpoint tetap dalam anggaran pada trace overload, dan
+# resimulate dari checkpoint menghasilkan jadwal yang sama dengan simulate dari awal.
+
+import random
+
+import pytest
+
+import scheduler
+from incremental import resimulate, simulate
+from scheduler import ALGORITHMS, ProcessTable
+from workloads import poisson_workload
+
+
+def checkpoint_entries(simulation):
+    return {algorithm: sum(checkpoint.entries() for checkpoint in checkpoints)
+            for algorithm, (_, _, checkpoints) in simulation.runs.items()}
+
+
+def schedule(entry):
+    processes = [(p.pid, p.start_time, p.completion_time, p.turnaround_time, p.waiting_time)
+                 for p in entry['processes']]
+    return processes, list(entry['gantt_chart']), entry['metrics']
+
+
+def edit(rows, rng):
+    """ Satu sampai tiga edit acak: tambah, hapus, atau ubah arrival/burst satu proses. """
+    rows = list(rows)
+    for _ in range(rng.randint(1, 3)):
+        operation = rng.choice('arc') if rows else 'a'
+        if operation == 'a':
+            rows.append((len(rows) + 1000, rng.randint(0, 400), rng.randint(1, 12), rng.randint(0, 9)))
+        elif operation == 'r':
+            rows.pop(rng.randrange(len(rows)))
+        else:
+            index = rng.randrange(len(rows))
+            pid, arrival, burst, priority = rows[index]
+            rows[index] = (pid, rng.randint(0, 400), burst, priority) if rng.random() < 0.5 else \
+                (pid, arrival, rng.randint(1, 12), priority)
+    return rows
+
+
+def test_checkpoint_memory_within_budget_on_overloaded_trace(monkeypatch):
+    monkeypatch.setattr(scheduler, 'CHECKPOINT_INTERVAL', 16)
+    monkeypatch.setattr(scheduler, 'CHECKPOINT_BUDGET', 2000)
+    simulation = simulate(poisson_workload(5000, load=2.0))
+    entries = checkpoint_entries(simulation)
+    # Tanpa anggaran, ready queue yang menumpuk disalin setiap 16 event (jutaan entri untuk Round Robin)
+    assert max(entries.values()) <= 2000, entries
+    for _, _, checkpoints in simulation.runs.values():
+        assert len(checkpoints) > 1
+        horizons = [checkpoint.horizon for checkpoint in checkpoints]
+        assert horizons == sorted(horizons)
+
+
+@pytest.mark.parametrize('seed', range(10))
+def test_resimulate_matches_simulate(seed, monkeypatch):
+    rng = random.Random(seed)
+    monkeypatch.setattr(scheduler, 'CHECKPOINT_INTERVAL', rng.choice([1, 2, 5]))
+    monkeypatch.setattr(scheduler, 'CHECKPOINT_BUDGET', rng.choice([50, 400, 1 << 17]))
+    rows = [(pid, rng.randint(0, 400), rng.randint(1, 12), rng.randint(0, 9)) for pid in range(1, 150)]
+    time_quantum, aging_interval = rng.choice([1, 2, 3]), rng.choice([None, 2])
+    base = simulate(ProcessTable.from_tuples(rows), time_quantum, aging_interval)
+    resumed = 0
+    for _ in range(5):
+        rows = edit(rows, rng)
+        incremental = resimulate(base, ProcessTable.from_tuples(rows))
+        full = simulate(ProcessTable.from_tuples(rows), time_quantum, aging_interval)
+        for algorithm in ALGORITHMS:
+            assert schedule(incremental.results[algorithm]) == schedule(full.results[algorithm]), algorithm
+        assert max(checkpoint_entries(incremental).values()) <= scheduler.CHECKPOINT_BUDGET
+        resumed += sum(time is not None for time in incremental.resumed_from.values())
+        base = incremental
+    assert resumed
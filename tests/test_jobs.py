@@ -0,0 +1,61 @@
+# Uji JobManager (jobs.py): keputusan inline vs process pool berdasarkan perkiraan biaya
+
+import time
+
+import pytest
+
+import jobs
+from jobs import DONE, INLINE_JOB_LIMIT, JobManager, estimate_cost
+from scheduler import ALGORITHMS, ProcessTable
+
+
+def test_estimate_cost_counts_round_robin_quanta():
+    table = ProcessTable.from_tuples([(1, 0, 10 ** 9, 0), (2, 0, 10 ** 9, 0)])
+    assert estimate_cost(table, ['FCFS'], 1) < INLINE_JOB_LIMIT
+    assert estimate_cost(table, ['Round Robin'], 1) > 2 * 10 ** 9
+
+
+def test_cheap_job_runs_inline():
+    manager = JobManager()
+    job = manager.submit(ProcessTable.from_tuples([(1, 0, 5, 2), (2, 1, 3, 1)]))
+    assert job.status == DONE and job._future is None
+    assert set(job.results) == set(ALGORITHMS)
+
+
+def test_few_processes_with_long_bursts_run_in_background():
+    manager = JobManager(workers=1)
+    try:
+        job = manager.submit(ProcessTable.from_tuples([(1, 0, 10 ** 5, 0), (2, 0, 10 ** 5, 0)]),
+                             algorithms=['Round Robin'], time_quantum=1)
+        assert job._future is not None
+        job._future.result(timeout=60)
+        deadline = time.monotonic() + 10
+        while job.status != DONE and time.monotonic() < deadline:  # Callback future berjalan di thread lain
+            time.sleep(0.01)
+        assert job.status == DONE
+        assert job.results['Round Robin']['metrics']['makespan'] == 2 * 10 ** 5
+    finally:
+        manager.shutdown()
+
+
+def test_summary_reads_stored_context_switches(monkeypatch):
+    job = JobManager().submit(ProcessTable.from_tuples([(1, 0, 5, 2), (2, 1, 3, 1)]), algorithms=['Round Robin'])
+    switches = job.results['Round Robin']['context_switches']
+    monkeypatch.setattr(jobs, 'count_context_switches', lambda gantt_chart: pytest.fail('Gantt chart ditelusuri ulang'))
+    assert job.summary()['results']['Round Robin']['context_switches'] == switches
+
+
+def test_batch_runs_inline_only_within_total_limit():
+    manager = JobManager(workers=1, inline_limit=100)
+    table = ProcessTable.from_tuples([(1, 0, 5, 2), (2, 1, 3, 1)])
+    cost = estimate_cost(table, ALGORITHMS, 2)
+    try:
+        outcomes = manager.submit_batch([(table, ALGORITHMS, 2)] * 10 + [ValueError('rusak')])
+        inline = [job for job in outcomes[:10] if job._future is None]
+        assert len(inline) == 100 // cost and all(job.status == DONE for job in inline)
+        assert isinstance(outcomes[10], ValueError)
+        for job in outcomes[:10]:
+            if job._future is not None:
+                job._future.result(timeout=60)
+    finally:
+        manager.shutdown()
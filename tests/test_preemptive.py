@@ -0,0 +1,74 @@
+# Uji mesin preemptive (SRTF dan Priority Preemptive, dengan dan tanpa aging) terhadap simulator naif
+# per satuan waktu: setiap tick semua proses dievaluasi ulang, jadi tidak ada event yang bisa terlewat.
+
+import pytest
+
+from scheduler import ProcessTable, ScheduleResult, _run_engine
+from test_equivalence import SEEDS, random_rows
+
+
+def naive_preemptive(rows, value):
+    """
+    Simulasi per tick: proses menunggu dengan nilai (value, posisi kedatangan) terkecil merebut CPU jika
+    nilainya lebih kecil secara ketat dari proses yang berjalan. `value(state)` menerima dict
+    {'priority', 'remaining', 'waited'} satu proses; 'waited' hanya bertambah selama proses menunggu.
+    """
+    pending = sorted(rows, key=lambda row: row[1])
+    states = [{'priority': row[3], 'remaining': row[2], 'waited': 0} for row in pending]
+    rank = lambda position: (value(states[position]), position)
+    ready, running, index, time, results, start = [], None, 0, 0, {}, {}
+    while len(results) < len(pending):
+        while index < len(pending) and pending[index][1] <= time:
+            ready.append(index)
+            index += 1
+        if running is not None and ready:
+            best = min(ready, key=rank)
+            if value(states[best]) < value(states[running]):
+                ready.append(running)
+                running = None
+        if running is None and ready:
+            running = min(ready, key=rank)
+            ready.remove(running)
+            start.setdefault(running, time)
+        time += 1
+        for position in ready:
+            states[position]['waited'] += 1
+        if running is not None:
+            states[running]['remaining'] -= 1
+            if not states[running]['remaining']:
+                pid, arrival, burst, _ = pending[running]
+                results[pid] = (start[running], time, time - arrival, time - arrival - burst)
+                running = None
+    return results
+
+
+def engine_results(rows, algorithm, aging_interval=None):
+    table = ProcessTable.from_tuples(rows)
+    result, _ = _run_engine(table, algorithm, 2, aging_interval=aging_interval)
+    return {table.pid[row]: tuple(getattr(result, name)[row] for name in ScheduleResult.COLUMNS)
+            for row in range(len(table))}
+
+
+def aged_priority(aging_interval):
+    return lambda state: state['priority'] * aging_interval - state['waited']
+
+
+def test_aging_preempts_between_events():
+    # P2 menyalip P1 pada t=3 (3 - 3 < 1), bukan baru saat P1 selesai pada t=10
+    rows = [(1, 0, 10, 1), (2, 0, 1, 3)]
+    results = engine_results(rows, 'Preemptive Priority', aging_interval=1)
+    assert results[2] == (3, 4, 4, 3)
+    assert results == naive_preemptive(rows, aged_priority(1))
+    # Proses lain yang tidak terkait tidak mengubah jadwal P1 dan P2
+    extended = engine_results(rows + [(3, 5, 1, 9)], 'Preemptive Priority', aging_interval=1)
+    assert {pid: extended[pid] for pid in (1, 2)} == results
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_preemptive_engines_match_naive_simulator(seed):
+    rows = random_rows(seed)
+    assert engine_results(rows, 'SRTF') == naive_preemptive(rows, lambda state: state['remaining'])
+    assert engine_results(rows, 'Preemptive Priority') == naive_preemptive(rows, lambda state: state['priority'])
+    for aging_interval in (1, 2, 3, 5):
+        assert (engine_results(rows, 'Preemptive Priority', aging_interval)
+                == naive_preemptive(rows, aged_priority(aging_interval)))
@@ -0,0 +1,32 @@
+# Uji validasi time quantum pada parameter sweep (scheduler.sweep dan opsi CLI --quanta) dan run_all_schedulers
+
+import argparse
+
+import pytest
+
+from scheduler import _parse_quanta, get_default_processes, run_all_schedulers, sweep
+
+
+@pytest.mark.parametrize('quanta', [[0], [-1, 2], [2, 0]])
+def test_sweep_rejects_non_positive_quanta(quanta):
+    with pytest.raises(ValueError):
+        list(sweep(get_default_processes(), ['Round Robin'], quanta=quanta))
+
+
+@pytest.mark.parametrize('time_quantum', [0, -3])
+def test_run_all_schedulers_rejects_non_positive_quantum(time_quantum):
+    with pytest.raises(ValueError):
+        run_all_schedulers(get_default_processes(), time_quantum=time_quantum)
+
+
+@pytest.mark.parametrize('text', ['-1,2', '0', '5:1', '0:3', '1:5:0'])
+def test_parse_quanta_rejects_invalid(text):
+    with pytest.raises(argparse.ArgumentTypeError):
+        _parse_quanta(text)
+
+
+def test_parse_quanta_accepts_ranges_and_lists():
+    assert list(_parse_quanta('1:5:2')) == [1, 3, 5]
+    assert _parse_quanta('1,2,4') == [1, 2, 4]
+    rows = list(sweep(get_default_processes(), ['Round Robin', 'FCFS'], quanta=_parse_quanta('1:3')))
+    assert [row.time_quantum for row in rows] == [1, 2, 3, None]
@@ -0,0 +1,184 @@
+# File trace_loader.py: Loader trace workload berukuran besar untuk scheduler.py
+# Mendukung CSV (dibaca per chunk) dan format biner kolumnar berukuran tetap yang bisa
+# di-memory-map langsung menjadi kolom input ProcessTable tanpa salinan (zero-copy).
+
+import argparse
+import csv
+import io
+import mmap
+import struct
+import sys
+from array import array
+
+from scheduler import ProcessTable, _as_numpy, _typecode, np
+
+# Format biner: header 24 byte lalu 4 blok kolom int64 little-endian (pid, arrival, burst, priority).
+# Tata letak kolumnar membuat setiap kolom bisa di-view langsung dari mmap.
+BINARY_MAGIC = b'CPUTRACE'
+BINARY_VERSION = 1
+_HEADER = struct.Struct('<8sIIQ')  # magic, versi, cadangan, jumlah baris
+BINARY_COLUMNS = ('pid', 'arrival_time', 'burst_time', 'priority')
+
+# Jumlah baris CSV yang diproses per chunk
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def parse_process_row(values):
+    """
+    Validasi satu baris proses (pid, arrival_time, burst_time, priority) dengan aturan yang sama
+    seperti form web: semua nilai wajib bilangan bulat dan burst time harus positif.
+    Mengembalikan tuple integer, atau None jika baris harus dilewati.
+    """
+    try:
+        pid, arrival, burst, priority = (int(values[i]) for i in range(4))
+    except (ValueError, IndexError):
+        return None
+    if burst <= 0:
+        return None
+    return pid, arrival, burst, priority
+
+
+# --- CSV ---
+def iter_csv_rows(source):
+    """
+    Generator baris CSV yang valid sebagai tuple (pid, arrival_time, burst_time, priority).
+    `source` boleh berupa path atau file object. Header dan baris tidak valid dilewati.
+    Cocok sebagai input mode streaming (streaming.py) jika file sudah terurut berdasarkan arrival time.
+    """
+    if isinstance(source, str):
+        with open(source, newline='') as stream:
+            yield from iter_csv_rows(stream)
+        return
+    for record in csv.reader(source):
+        row = parse_process_row(record)
+        if row is not None:
+            yield row
+
+def iter_csv_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Membaca CSV per chunk: setiap chunk berupa 4 kolom array('q') berisi maksimal chunk_size baris valid. """
+    columns = tuple(array('q') for _ in BINARY_COLUMNS)
+    for row in iter_csv_rows(source):
+        for column, value in zip(columns, row):
+            column.append(value)
+        if len(columns[0]) >= chunk_size:
+            yield columns
+            columns = tuple(array('q') for _ in BINARY_COLUMNS)
+    if len(columns[0]):
+        yield columns
+
+def load_csv(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Memuat CSV ke ProcessTable: nilai langsung dikemas ke kolom int64 per chunk, tanpa objek Process per baris. """
+    columns = tuple(array('q') for _ in BINARY_COLUMNS)
+    for chunk in iter_csv_chunks(source, chunk_size):
+        for column, values in zip(columns, chunk):
+            column.extend(values)
+    return ProcessTable(*columns)
+
+
+# --- Format Biner (Memory-Mapped) ---
+def _column_bytes(column):
+    """ Isi kolom sebagai byte int64 little-endian. """
+    if _typecode(column) != 'q':
+        column = array('q', column)  # Format biner hanya menyimpan bilangan bulat
+    if np is not None:
+        return _as_numpy(column).astype('<i8', copy=False).tobytes()
+    packed = array('q', column)
+    if sys.byteorder == 'big':
+        packed.byteswap()
+    return packed.tobytes()
+
+def write_binary(table, path):
+    """ Menyimpan ProcessTable ke file biner kolumnar (lihat BINARY_MAGIC) untuk dimuat ulang via mmap. """
+    with open(path, 'wb') as stream:
+        stream.write(_HEADER.pack(BINARY_MAGIC, BINARY_VERSION, 0, len(table)))
+        for name in BINARY_COLUMNS:
+            stream.write(_column_bytes(getattr(table, name)))
+
+def _filter_valid(columns):
+    """ Menerapkan aturan validasi (burst > 0) pada kolom biner; hanya menyalin jika ada baris yang tidak valid. """
+    burst = columns[2]
+    if np is not None:
+        valid = _as_numpy(burst) > 0
+        if valid.all():
+            return columns
+        return tuple(_as_numpy(column)[valid] for column in columns)
+    if all(value > 0 for value in burst):
+        return columns
+    keep = [row for row, value in enumerate(burst) if value > 0]
+    return tuple(array('q', (column[row] for row in keep)) for column in columns)
+
+def _check_header(header, source):
+    """ Validasi header file biner, mengembalikan jumlah baris. """
+    if len(header) < _HEADER.size:
+        raise ValueError(f"File trace biner terlalu pendek: {source}")
+    magic, version, _, count = _HEADER.unpack(header[:_HEADER.size])
+    if magic != BINARY_MAGIC or version != BINARY_VERSION:
+        raise ValueError(f"Bukan file trace biner versi {BINARY_VERSION}: {source}")
+    return count
+
+def _table_from_buffer(buffer, count, source):
+    """ Membangun ProcessTable dari isi file biner (header + blok kolom) tanpa menyalin kolom. """
+    if len(buffer) < _HEADER.size + 8 * count * len(BINARY_COLUMNS):
+        raise ValueError(f"File trace biner terpotong: {source}")
+    columns = []
+    for index in range(len(BINARY_COLUMNS)):
+        offset = _HEADER.size + 8 * count * index
+        column = buffer[offset:offset + 8 * count]
+        if sys.byteorder == 'little':
+            column = column.cast('q')
+        else:
+            packed = array('q')
+            packed.frombytes(column)
+            packed.byteswap()  # File little-endian, mesin big-endian
+            column = packed
+        columns.append(column)
+    return ProcessTable(*_filter_valid(columns))
+
+def load_binary(path, use_mmap=True):
+    """
+    Memuat file biner ke ProcessTable. Dengan use_mmap=True setiap kolom adalah memoryview di atas
+    mmap file (zero-copy): 50 juta baris dimuat tanpa membuat satu pun objek Python per baris,
+    dan halaman file baru dibaca dari disk saat kolom benar-benar diakses.
+    """
+    with open(path, 'rb') as stream:
+        count = _check_header(stream.read(_HEADER.size), path)
+        if use_mmap and count and sys.byteorder == 'little':
+            buffer = memoryview(mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ))
+        else:
+            stream.seek(0)
+            buffer = memoryview(stream.read())
+    return _table_from_buffer(buffer, count, path)
+
+
+def load_trace(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Memuat trace berdasarkan isinya: file biner (diawali BINARY_MAGIC) via mmap, selain itu CSV. """
+    with open(path, 'rb') as stream:
+        is_binary = stream.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    if is_binary:
+        return load_binary(path)
+    return load_csv(path, chunk_size)
+
+
+def load_trace_stream(stream, source='<stream>', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Memuat trace dari file object biner (misal file yang di-upload ke API web), tanpa menyimpannya ke disk.
+    Format dideteksi dari isinya seperti load_trace; CSV dibaca per chunk, file biner dibaca ke memori.
+    """
+    content = stream.read()
+    if content[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return _table_from_buffer(memoryview(content), _check_header(content, source), source)
+    return load_csv(io.StringIO(content.decode('utf-8-sig')), chunk_size)
+
+
+def main(argv=None):
+    """ CLI konversi: `python trace_loader.py trace.csv trace.bin` mengubah CSV menjadi format biner. """
+    parser = argparse.ArgumentParser(description='Konversi trace CSV ke format biner memory-mapped.')
+    parser.add_argument('source', help='File trace CSV (pid,arrival_time,burst_time,priority)')
+    parser.add_argument('target', help='File biner tujuan')
+    args = parser.parse_args(argv)
+    table = load_csv(args.source)
+    write_binary(table, args.target)
+    print(f"{len(table)} proses ditulis ke {args.target}")
+
+if __name__ == '__main__':
+    main()
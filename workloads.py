@@ -0,0 +1,91 @@
+# File workloads.py: Generator workload sintetis (seeded) untuk benchmark dan eksperimen
+# Setiap generator menghasilkan ProcessTable dengan kolom int64 yang terurut berdasarkan arrival_time.
+# Seed yang sama selalu menghasilkan workload yang sama (memakai random.Random, bukan NumPy),
+# sehingga baseline benchmark bisa dibandingkan antar commit dan antar mesin.
+
+import random
+from array import array
+
+from scheduler import ProcessTable
+
+# Rata-rata burst time dan beban CPU target (rata-rata burst / rata-rata jarak kedatangan)
+MEAN_BURST = 5
+TARGET_LOAD = 0.9
+PRIORITY_LEVELS = 10
+
+
+def _build_table(arrivals, bursts, rng):
+    """ Melengkapi kolom pid (1..n) dan priority acak, lalu mengemas semuanya ke ProcessTable. """
+    n = len(arrivals)
+    pids = array('q', range(1, n + 1))
+    priorities = array('q', (rng.randrange(PRIORITY_LEVELS) for _ in range(n)))
+    return ProcessTable(pids, arrivals, bursts, priorities)
+
+def _exponential_burst(rng):
+    return max(1, round(rng.expovariate(1 / MEAN_BURST)))
+
+
+def poisson_workload(n, seed=0, load=TARGET_LOAD):
+    """ Kedatangan Poisson (jarak antar kedatangan eksponensial) dengan burst eksponensial, beban CPU `load`. """
+    rng = random.Random(seed)
+    rate = load / MEAN_BURST
+    arrivals, bursts = array('q'), array('q')
+    clock = 0.0
+    for _ in range(n):
+        clock += rng.expovariate(rate)
+        arrivals.append(int(clock))
+        bursts.append(_exponential_burst(rng))
+    return _build_table(arrivals, bursts, rng)
+
+def heavy_tailed_workload(n, seed=0, load=TARGET_LOAD, alpha=1.5):
+    """
+    Kedatangan Poisson dengan burst heavy-tailed (Pareto, alpha 1.5): kebanyakan job pendek,
+    sedikit job sangat panjang yang mendominasi waktu CPU (kasus sulit untuk FCFS).
+    """
+    rng = random.Random(seed)
+    scale = MEAN_BURST * (alpha - 1) / alpha  # Rata-rata Pareto = scale * alpha / (alpha - 1)
+    rate = load / MEAN_BURST
+    arrivals, bursts = array('q'), array('q')
+    clock = 0.0
+    for _ in range(n):
+        clock += rng.expovariate(rate)
+        arrivals.append(int(clock))
+        bursts.append(max(1, round(scale * rng.paretovariate(alpha))))
+    return _build_table(arrivals, bursts, rng)
+
+def bursty_workload(n, seed=0, load=TARGET_LOAD, mean_group=50):
+    """
+    Kedatangan berkelompok: rombongan job (rata-rata `mean_group`) tiba hampir bersamaan, dipisah
+    jeda panjang sehingga beban rata-rata tetap `load`. Ready queue sangat dalam saat rombongan tiba.
+    """
+    rng = random.Random(seed)
+    gap = mean_group * MEAN_BURST / load
+    arrivals, bursts = array('q'), array('q')
+    clock = 0.0
+    while len(arrivals) < n:
+        clock += rng.expovariate(1 / gap)
+        group = min(n - len(arrivals), 1 + int(rng.expovariate(1 / mean_group)))
+        for offset in sorted(rng.random() * MEAN_BURST for _ in range(group)):
+            arrivals.append(int(clock + offset))
+            bursts.append(_exponential_burst(rng))
+        clock = max(clock, arrivals[-1])  # Rombongan berikutnya tidak tiba sebelum rombongan ini
+    return _build_table(arrivals, bursts, rng)
+
+def sparse_workload(n, seed=0, load=0.1):
+    """ Kedatangan jarang (beban CPU 10%): CPU sering idle, menguji lompatan waktu idle. """
+    return poisson_workload(n, seed, load)
+
+
+# Nama workload (untuk CLI benchmark) ke generatornya
+WORKLOADS = {
+    'poisson': poisson_workload,
+    'heavy_tailed': heavy_tailed_workload,
+    'bursty': bursty_workload,
+    'sparse': sparse_workload,
+}
+
+def generate_workload(name, n, seed=0):
+    """ Membuat workload berdasarkan nama dari WORKLOADS. """
+    if name not in WORKLOADS:
+        raise ValueError(f"Workload tidak dikenal: {name}")
+    return WORKLOADS[name](n, seed)